@@ -14,6 +14,7 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
+import hashlib
 import os
 import sys
 from pathlib import Path
@@ -33,16 +34,38 @@ import psy_simple
 
 
 def generate_apidoc(app):
+    """Run sphinx-apidoc for `app` unless its sources did not change.
+
+    A hash of the paths and modification times of all python files is stored
+    in ``api/.apidoc-stamp`` and the (filesystem bound) apidoc run is skipped
+    if it matches the one from the previous build. Added, removed or renamed
+    modules therefore invalidate the stamp as well. An existing ``api``
+    directory without stamp is kept as it is."""
     appdir = Path(app.__file__).parent
+    sources = sorted(
+        (str(p.relative_to(appdir)), p.stat().st_mtime)
+        for p in appdir.rglob("*.py")
+    )
+    digest = hashlib.sha256(repr(sources).encode()).hexdigest()
+    stamp = api / ".apidoc-stamp"
+    if api.exists() and not stamp.exists():
+        stamp.write_text(digest)
+        return
+    if stamp.exists() and stamp.read_text() == digest:
+        return
+    # remove the files of modules that do not exist anymore
+    for rst in api.glob("*.rst"):
+        rst.unlink()
+    api.mkdir(exist_ok=True)
     apidoc.main(
         ["-fMEeTo", str(api), str(appdir), str(appdir / "migrations" / "*")]
     )
+    stamp.write_text(digest)
 
 
 api = Path("api")
 
-if not api.exists():
-    generate_apidoc(psy_simple)
+generate_apidoc(psy_simple)
 
 # -- Project information -----------------------------------------------------
 
@@ -11,9 +11,16 @@ Psyplot plugin for simple visualization tasks
 
 from __future__ import annotations
 
-from . import _version
 
-__version__ = _version.get_versions()["version"]
+def __getattr__(name: str):
+    # the version is computed lazily as versioneer might need to call git
+    if name == "__version__":
+        from . import _version
+
+        version = globals()[name] = _version.get_versions()["version"]
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __author__ = "Philipp S. Sommer"
 __copyright__ = """
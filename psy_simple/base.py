@@ -13,18 +13,26 @@ matplotlib figures, such as axes title, figure title, etc.
 
 
 import inspect
+import os
+import re
 from abc import abstractmethod
 from collections import defaultdict
+from functools import lru_cache
 from itertools import chain
 
+import matplotlib.colors as mcol
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import six
 from psyplot.data import InteractiveList, open_dataset
 from psyplot.docstring import dedent, docstrings, safe_modulo
 from psyplot.plotter import START, Formatoption, Plotter, rcParams
 
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
 docstrings.params["replace_note"] = inspect.cleandoc(
     """
     You can insert any meta key from the :attr:`xarray.DataArray.attrs` via a
@@ -45,8 +53,7 @@ docstrings.params["replace_note"] = inspect.cleandoc(
 
       - %s"""
     % "\n      - ".join(
-        "%s: ``%s``" % tuple(item)
-        for item in six.iteritems(rcParams["texts.labels"])
+        "%s: ``%s``" % tuple(item) for item in rcParams["texts.labels"].items()
     )
 )
 
@@ -83,6 +90,72 @@ docstrings.params["fontsizes"] = inspect.cleandoc(
 )
 
 
+#: pattern of the ``'%(key)s'`` substitutions in a string
+_key_pattern = re.compile(r"(?s)(?<!%)(%%)*%(?!%)\((?P<key>.*?)\)")
+
+#: pattern of the remaining format directives (e.g. ``'%Y'``) in a string
+_directive_pattern = re.compile(r"(?<!%)(%%)*%(?!%)\s*(\w|$)")
+
+
+@lru_cache(maxsize=128)
+def _compile_modulo(s):
+    """Prepare a string for the modulo operation with a mapping
+
+    Parameters
+    ----------
+    s: str
+        The string to insert the attributes in
+
+    Returns
+    -------
+    str or None
+        `s` with all format directives that are not a ``'%(key)s'``
+        substitution (e.g. ``'%Y'``) escaped. None, if `s` contains a
+        directive that would accept the mapping itself (``'%s'``, ``'%r'`` or
+        ``'%a'``)
+    tuple of str
+        The keys of the ``'%(key)s'`` substitutions"""
+    keys = tuple(m.group("key") for m in _key_pattern.finditer(s))
+    if any(m.group(2) in "sra" for m in _directive_pattern.finditer(s)):
+        return None, keys
+    return _directive_pattern.sub(r"%\g<0>", s), keys
+
+
+def _safe_modulo(s, attrs):
+    """Insert the `attrs` into `s` like :func:`psyplot.docstring.safe_modulo`
+
+    The string is compiled once with :func:`_compile_modulo` such that the
+    modulo operation can be applied directly if all keys are in `attrs`.
+    Otherwise we fall back to :func:`~psyplot.docstring.safe_modulo`."""
+    template, keys = _compile_modulo(s)
+    if template is not None and all(key in attrs for key in keys):
+        try:
+            return template % attrs
+        except (ValueError, TypeError):
+            pass
+    return safe_modulo(s, attrs)
+
+
+def _replace(s, labels, attrs, time=None):
+    """Insert the `labels`, `attrs` and `time` into the string `s`
+
+    See :meth:`TextBase.replace`, `time` is the string representation of a
+    scalar time coordinate (if any)."""
+    # insert labels
+    if "{" in s or "}" in s:
+        s = s.format(**labels)
+    if "%" not in s:  # nothing left to replace
+        return s
+    # replace attributes
+    s = _safe_modulo(s, attrs)
+    if time is not None:
+        try:  # assume a valid datetime.datetime instance
+            s = pd.to_datetime(time).strftime(s)
+        except ValueError:
+            pass
+    return s
+
+
 class TextBase(object):
     """Abstract base class for formatoptions that provides a replace method"""
 
@@ -102,7 +175,9 @@ class TextBase(object):
         try:
             return self._rc
         except AttributeError:
-            return rcParams.find_and_replace(base_str=["texts."])
+            # the SubDict is a view on the rcParams, so we can keep it
+            self._rc = rcParams.find_and_replace(base_str=["texts."])
+            return self._rc
 
     data_dependent = True
 
@@ -128,30 +203,68 @@ class TextBase(object):
         -------
         str
             `s` with inserted informations"""
-        # insert labels
-        s = s.format(**self.rc["labels"])
+        if "%" not in s and "{" not in s and "}" not in s:
+            # literal string, nothing to replace
+            return s
+        labels = self.rc["labels"]
         # replace attributes
         attrs = attrs or data.attrs
         if hasattr(getattr(data, "psy", None), "arr_name"):
             attrs = attrs.copy()
             attrs["arr_name"] = data.psy.arr_name
-        s = safe_modulo(s, attrs)
         # replace datetime.datetime like time informations
         if isinstance(data, InteractiveList):
             data = data[0]
-        tname = self.any_decoder.get_tname(
-            next(self.plotter.iter_base_variables), data.coords
-        )
+        tname = self._get_tname(data)
+        time = None
         if tname is not None and tname in data.coords:
             time = data.coords[tname]
-            if not time.values.ndim:
-                try:  # assume a valid datetime.datetime instance
-                    s = pd.to_datetime(str(time.values[()])).strftime(s)
-                except ValueError:
-                    pass
-        if six.PY2:
-            return s.decode("utf-8")
-        return s
+            time = str(time.values[()]) if not time.values.ndim else None
+        return _replace(s, labels, attrs, time)
+
+    @staticmethod
+    def _uses_attrs(s):
+        """Check whether the meta attributes are needed to fill in `s`
+
+        This is used to avoid the computation of the enhanced attributes for
+        strings without ``'%(key)s'`` substitutions, such as literal strings
+        or pure datetime formats"""
+        if "{" in s or "}" in s:
+            # labels like ``'{desc}'`` may insert ``'%(key)s'`` substitutions
+            return True
+        if "%" not in s:
+            return False
+        template, keys = _compile_modulo(s)
+        return template is None or bool(keys)
+
+    def _get_attrs_for(self, s):
+        """Get the enhanced attributes if they are needed to fill in `s`
+
+        If they are not needed, they are not computed and ``None`` is
+        returned. During a replot, the previously cached attributes are
+        dropped because they do not match the new data anymore"""
+        if self._uses_attrs(s):
+            return self.enhanced_attrs
+        if self.plotter.replot:
+            self.__dict__.pop("_enhanced_attrs", None)
+        return None
+
+    def _get_tname(self, data):
+        """Get the name of the time coordinate in `data`
+
+        The result is cached for the coordinate names of `data` until the
+        plotter replots the data"""
+        coords = tuple(data.coords)
+        cache = getattr(self, "_tnames", None)
+        if cache is None or self.plotter.replot:
+            cache = self._tnames = {}
+        try:
+            return cache[coords]
+        except KeyError:
+            tname = cache[coords] = self.any_decoder.get_tname(
+                next(self.plotter.iter_base_variables), data.coords
+            )
+            return tname
 
     def get_fig_data_attrs(self, delimiter=None):
         """Join the data attributes with other plotters in the project
@@ -173,12 +286,12 @@ class TextBase(object):
             A dictionary with all the meta attributes joined by the specified
             `delimiter`"""
         if self.project is not None:
-            delimiter = next(
-                filter(
-                    lambda d: d is not None,
-                    [delimiter, self.delimiter, self.rc["delimiter"]],
+            if delimiter is None:
+                delimiter = (
+                    self.delimiter
+                    if self.delimiter is not None
+                    else self.rc["delimiter"]
                 )
-            )
             figs = self.project.figs
             fig = self.ax.get_figure()
             if self.plotter._initialized and fig in figs:
@@ -298,11 +411,9 @@ def label_weight(
             """Get a widget with the different font weights"""
             from psy_simple.widgets.texts import FontWeightWidget
 
+            texts = getattr(self, base.key).texts
             return FontWeightWidget(
-                parent,
-                self,
-                next(iter(getattr(self, base.key).texts), None),
-                base,
+                parent, self, texts[0] if texts else None, base
             )
 
     return LabelWeight(base.key + "weight")
@@ -367,11 +478,9 @@ def label_size(
             """Get a widget with the different font weights"""
             from psy_simple.widgets.texts import FontSizeWidget
 
+            texts = getattr(self, base.key).texts
             return FontSizeWidget(
-                parent,
-                self,
-                next(iter(getattr(self, base.key).texts), None),
-                base,
+                parent, self, texts[0] if texts else None, base
             )
 
     return LabelSize(base.key + "size")
@@ -457,10 +566,10 @@ def label_props(
         def update(self, fontprops):
             fontprops = fontprops.copy()
             # store default font properties
-            try:
-                text = next(iter(getattr(self, base.key).texts))
-            except StopIteration:
+            texts = getattr(self, base.key).texts
+            if not texts:
                 return
+            text = texts[0]
             # TODO: This handling of the default management is not really
             # satisfying because you run into troubles when using alternate
             # property names (e.g. if you use 'ha' and 'horizontalalignment'
@@ -479,7 +588,7 @@ def label_props(
                 fontprops["size"] = getattr(self, base.key + "size").value
             if "weight" not in fontprops and "fontweight" not in fontprops:
                 fontprops["weight"] = getattr(self, base.key + "weight").value
-            for text in getattr(self, base.key).texts:
+            for text in texts:
                 text.update(fontprops)
             self._todefault = False
 
@@ -487,11 +596,9 @@ def label_props(
             """Get a widget with the different font weights"""
             from psy_simple.widgets.texts import FontPropertiesWidget
 
+            texts = getattr(self, base.key).texts
             return FontPropertiesWidget(
-                parent,
-                self,
-                next(iter(getattr(self, base.key).texts), None),
-                base,
+                parent, self, texts[0] if texts else None, base
             )
 
     return LabelProps(base.key + "props")
@@ -521,18 +628,13 @@ class Title(TextBase, Formatoption):
     name = "Axes title"
 
     def initialize_plot(self, value):
-        arr = self.data
-        self.texts = [
-            self.ax.set_title(
-                self.replace(value, arr, attrs=self.enhanced_attrs)
-            )
-        ]
+        self.texts = [self.ax.set_title(self._get_title(value))]
 
     def update(self, value):
-        arr = self.data
-        self.texts[0].set_text(
-            self.replace(value, arr, attrs=self.enhanced_attrs)
-        )
+        self.texts[0].set_text(self._get_title(value))
+
+    def _get_title(self, value):
+        return self.replace(value, self.data, attrs=self._get_attrs_for(value))
 
 
 class Figtitle(TextBase, Formatoption):
@@ -570,29 +672,26 @@ class Figtitle(TextBase, Formatoption):
 
     def initialize_plot(self, s):
         if s:
-            self.texts = [
-                self.ax.get_figure().suptitle(
-                    self.replace(s, self.plotter.data, self.enhanced_attrs)
-                )
-            ]
+            self.texts = [self.ax.get_figure().suptitle(self._get_title(s))]
             self.clear_other_texts()
         else:
             self.texts = [self.ax.get_figure().suptitle("")]
 
     def update(self, s):
         if s:
-            self.texts[0].set_text(
-                self.replace(s, self.plotter.data, self.enhanced_attrs)
-            )
+            self.texts[0].set_text(self._get_title(s))
             self.clear_other_texts()
         else:
             self.texts[0].set_text("")
 
+    def _get_title(self, s):
+        return self.replace(s, self.plotter.data, self._get_attrs_for(s))
+
     def clear_other_texts(self, remove=False):
         """Make sure that no other text is a the same position as this one
 
         This method clears all text instances in the figure that are at the
-        same position as the :attr:`_text` attribute
+        same position as the figure title of this formatoption
 
         Parameters
         ----------
@@ -603,14 +702,18 @@ class Figtitle(TextBase, Formatoption):
         # don't do anything if our figtitle is the only Text instance
         if len(fig.texts) == 1:
             return
-        for i, text in enumerate(fig.texts):
-            if text == self._text:
-                continue
-            if text.get_position() == self._text.get_position():
-                if not remove:
-                    text.set_text("")
-                else:
-                    del fig[i]
+        title = self.texts[0]
+        pos = title.get_position()
+        others = [
+            text
+            for text in fig.texts
+            if text is not title and text.get_position() == pos
+        ]
+        for text in others:
+            if not remove:
+                text.set_text("")
+            else:
+                text.remove()
 
 
 class Text(TextBase, Formatoption):
@@ -648,18 +751,36 @@ class Text(TextBase, Formatoption):
     def transform(self):
         """Dictionary containing the relevant transformations"""
         ax = self.ax
-        return {
-            "axes": ax.transAxes,
-            "fig": ax.get_figure().transFigure,
-            "data": ax.transData,
-        }
+        cache = self._transform_cache
+        if cache is None or cache[0] is not ax:
+            cache = self._transform_cache = (
+                ax,
+                {
+                    "axes": ax.transAxes,
+                    "fig": ax.get_figure().transFigure,
+                    "data": ax.transData,
+                },
+            )
+        return cache[1]
 
     def __init__(self, *args, **kwargs):
         Formatoption.__init__(self, *args, **kwargs)
         #: texts that shall be removed when updating
         self._texts_to_remove = set()
-        #: :class:`matplotlib.texts.Text` instances on the figure
-        self._texts = defaultdict(set)
+        #: :class:`matplotlib.texts.Text` instances on the figure, mapping
+        #: from coordinate system to the texts at position ``(x, y)``
+        self._texts = defaultdict(dict)
+        #: mapping from the position ``(x, y, cs)`` of a text tuple to its
+        #: index in the :attr:`value`
+        self._pos_index = {}
+        #: the axes and its transformations for the :attr:`transform`
+        self._transform_cache = None
+
+    def _index_texttuples(self):
+        """Rebuild the :attr:`_pos_index` from the current value"""
+        self._pos_index = pos_index = {}
+        for i, (x, y, s, cs, d) in enumerate(self.value):
+            pos_index.setdefault((x, y, cs), i)
 
     def _remove_texttuple(self, pos):
         """Remove a texttuple from the value in the plotter
@@ -668,20 +789,24 @@ class Text(TextBase, Formatoption):
         ----------
         pos: tuple (x, y, cs)
             x and y are the x- and y-positions and cs the coordinate system"""
-        for i, (old_x, old_y, s, old_cs, d) in enumerate(self.value):
-            if (old_x, old_y, old_cs) == pos:
-                self.value.pop(i)
-                return
-        raise ValueError("{0} not found!".format(pos))
+        try:
+            i = self._pos_index.pop(pos)
+        except KeyError:
+            raise ValueError("{0} not found!".format(pos))
+        self.value.pop(i)
+        pos_index = self._pos_index
+        for key, j in pos_index.items():
+            if j > i:
+                pos_index[key] = j - 1
 
     def _update_texttuple(self, x, y, s, cs, d):
         """Update the text tuple at `x` and `y` with the given `s` and `d`"""
         pos = (x, y, cs)
-        for i, (old_x, old_y, old_s, old_cs, old_d) in enumerate(self.value):
-            if (old_x, old_y, old_cs) == pos:
-                self.value[i] = (old_x, old_y, s, old_cs, d)
-                return
-        raise ValueError("No text tuple found at {0}!".format(pos))
+        try:
+            i = self._pos_index[pos]
+        except KeyError:
+            raise ValueError("No text tuple found at {0}!".format(pos))
+        self.value[i] = (x, y, s, cs, d)
 
     def set_value(self, value, validate=True, todefault=False):
         value = self.validate(value) if validate else value
@@ -690,10 +815,10 @@ class Text(TextBase, Formatoption):
             with self.plotter.no_validation:
                 self.plotter[self.key] = []
             for cs, texts in self._texts.items():
-                for t in texts:
-                    pos = t.get_position()
-                    self._texts_to_remove.add((pos[0], pos[1], cs))
+                for x, y in texts:
+                    self._texts_to_remove.add((x, y, cs))
 
+        self._index_texttuples()
         # loop through texttuples to see whether one changed or has to be
         # removed. x: x-coord, y: y-coord, s: string, cs: coord.-system,
         # d: text params dictionary
@@ -708,40 +833,44 @@ class Text(TextBase, Formatoption):
                 try:
                     self._update_texttuple(x, y, s, cs, d)
                 except ValueError:
+                    self._pos_index[(x, y, cs)] = len(self.value)
                     self.value.append((x, y, s, cs, d))
 
     def update(self, value, texts_to_remove=None):
         # remove texts
         for x, y, cs in texts_to_remove or self._texts_to_remove:
-            for t in self._texts[cs]:
-                if (x, y) == t.get_position():
-                    self._texts[cs].remove(t)
-                    t.remove()
-                    break
+            t = self._texts[cs].pop((x, y), None)
+            if t is not None:
+                t.remove()
         if self.plotter.replot:
             value = self.value + value
+            # the cached attributes do not match the new data anymore, even
+            # if none of the texts needs them now
+            self.__dict__.pop("_enhanced_attrs", None)
+        # joined figure attributes for the different delimiters
+        fig_attrs = {}
         # now update the old texts or create new ones
         for x, y, s, cs, d in value:
-            if cs == "fig":
-                s = self.replace(
-                    s,
-                    self.plotter.data,
-                    self.get_fig_data_attrs(d.pop("delimiter", None)),
-                )
+            delimiter = d.pop("delimiter", None) if cs == "fig" else None
+            if not self._uses_attrs(s):
+                s = self.replace(s, self.plotter.data)
+            elif cs == "fig":
+                try:
+                    attrs = fig_attrs[delimiter]
+                except KeyError:
+                    attrs = fig_attrs[delimiter] = self.get_fig_data_attrs(
+                        delimiter
+                    )
+                s = self.replace(s, self.plotter.data, attrs)
             else:
                 s = self.replace(s, self.plotter.data, self.enhanced_attrs)
-            found = False
-            for t in self._texts[cs]:
-                if (x, y) == t.get_position():
-                    t.set_text(s)
-                    t.update(d.copy())
-                    found = True
-                    break
-            if not found:
-                self._texts[cs].add(
-                    self.ax.text(
-                        x, y, s, d.copy(), transform=self.transform[cs]
-                    )
+            t = self._texts[cs].get((x, y))
+            if t is not None:
+                t.set_text(s)
+                t.update(d)
+            else:
+                self._texts[cs][(x, y)] = self.ax.text(
+                    x, y, s, d, transform=self.transform[cs]
                 )
 
     def share(self, fmto, **kwargs):
@@ -774,7 +903,9 @@ class Text(TextBase, Formatoption):
         self._texts_to_remove.clear()
 
     def remove(self):
-        for t in chain.from_iterable(six.itervalues(self._texts)):
+        for t in chain.from_iterable(
+            texts.values() for texts in self._texts.values()
+        ):
             t.remove()
         self._texts.clear()
 
@@ -825,13 +956,11 @@ class BackgroundColor(Formatoption):
 
     def update(self, value):
         if value == "rc":
-            self.ax.patch.set_facecolor(plt.rcParams["axes.facecolor"])
-            self.ax.set_facecolor(plt.rcParams["axes.facecolor"])
+            value = plt.rcParams["axes.facecolor"]
         elif value is None:
-            self.ax.patch.set_facecolor("none")
-            self.ax.set_facecolor("none")
-        else:
-            self.ax.patch.set_facecolor(value)
+            value = "none"
+        # do not mark the axes as stale if the color did not change
+        if mcol.to_rgba(value) != self.ax.patch.get_facecolor():
             self.ax.set_facecolor(value)
 
     def get_fmt_widget(self, parent, project):
@@ -849,9 +978,21 @@ class ValueMaskBase(Formatoption):
 
     data_dependent = True
 
+    #: Expression for :func:`numexpr.evaluate` that masks large arrays in a
+    #: single pass. ``v`` is the data, the other variables are given by the
+    #: :meth:`_ne_variables` method
+    _ne_expr = None
+
+    #: Minimum number of array elements to use :mod:`numexpr` (if installed)
+    _ne_min_size = 1 << 16
+
     @abstractmethod
-    def mask_func(self):
-        """The masking function that is called"""
+    def mask_func(self, data, value):
+        """The masking function that is called
+
+        Returns a boolean array that is True where `data` shall be masked.
+        Note that comparisons with NaN are always False, so missing values
+        do not need to be handled separately."""
         return
 
     def update(self, value):
@@ -861,12 +1002,27 @@ class ValueMaskBase(Formatoption):
             for i, data in enumerate(self.iter_data):
                 self.set_data(self._mask_data(data, value), i)
 
+    def _ne_variables(self, values, value):
+        """Get the variables for the :attr:`_ne_expr`"""
+        return {"t": values.dtype.type(value)}
+
     def _mask_data(self, data, value):
-        data = data.copy(data=np.copy(data.values))
-        data.values[~np.isnan(data.values)] = self.mask_func(
-            data.values[~np.isnan(data.values)], value
-        )
-        return data
+        values = data.values
+        if (
+            numexpr is not None
+            and self._ne_expr is not None
+            and values.size >= self._ne_min_size
+            and values.dtype.kind == "f"
+        ):
+            variables = self._ne_variables(values, value)
+            variables["v"] = values
+            variables["nan"] = values.dtype.type(np.nan)
+            return data.copy(
+                data=numexpr.evaluate(self._ne_expr, local_dict=variables)
+            )
+        values = np.copy(values)
+        np.putmask(values, self.mask_func(values, value), np.nan)
+        return data.copy(data=values)
 
 
 class MaskLess(ValueMaskBase):
@@ -885,9 +1041,10 @@ class MaskLess(ValueMaskBase):
 
     name = "Mask less"
 
+    _ne_expr = "where(v < t, nan, v)"
+
     def mask_func(self, data, value):
-        data[data < value] = np.nan
-        return data
+        return data < value
 
 
 class MaskLeq(ValueMaskBase):
@@ -906,9 +1063,10 @@ class MaskLeq(ValueMaskBase):
 
     name = "Mask lesser than or equal"
 
+    _ne_expr = "where(v <= t, nan, v)"
+
     def mask_func(self, data, value):
-        data[data <= value] = np.nan
-        return data
+        return data <= value
 
 
 class MaskGreater(ValueMaskBase):
@@ -927,9 +1085,10 @@ class MaskGreater(ValueMaskBase):
 
     name = "Mask greater"
 
+    _ne_expr = "where(v > t, nan, v)"
+
     def mask_func(self, data, value):
-        data[data > value] = np.nan
-        return data
+        return data > value
 
 
 class MaskGeq(ValueMaskBase):
@@ -948,9 +1107,10 @@ class MaskGeq(ValueMaskBase):
 
     name = "Mask greater than or equal"
 
+    _ne_expr = "where(v >= t, nan, v)"
+
     def mask_func(self, data, value):
-        data[data >= value] = np.nan
-        return data
+        return data >= value
 
 
 class MaskBetween(ValueMaskBase):
@@ -969,9 +1129,34 @@ class MaskBetween(ValueMaskBase):
 
     name = "Mask between two values"
 
+    _ne_expr = "where((v >= lo) & (v <= hi), nan, v)"
+
+    def _ne_variables(self, values, value):
+        return {
+            "lo": values.dtype.type(value[0]),
+            "hi": values.dtype.type(value[1]),
+        }
+
     def mask_func(self, data, value):
-        data[np.all([data >= value[0], data <= value[1]], axis=0)] = np.nan
-        return data
+        mask = data >= value[0]
+        mask &= data <= value[1]
+        return mask
+
+
+def _load_mask_dataset(path):
+    """Load the mask file at `path` into memory and close it"""
+    with open_dataset(path) as ds:
+        return ds.load()
+
+
+@lru_cache(maxsize=16)
+def _load_cached_mask_dataset(path, mtime):
+    """Load the mask file at the absolute `path` (cached)
+
+    The dataset is cached for the modification time `mtime` of the file such
+    that it is only loaded again when the file changes. The file itself is
+    closed right away, so evicted datasets do not leave open handles"""
+    return _load_mask_dataset(path)
 
 
 class Mask(Formatoption):
@@ -1011,25 +1196,82 @@ class Mask(Formatoption):
     def update(self, value):
         if value is None:
             return
+        # the masks for the different base datasets and data dimensions
+        sources = {}
+        # the dimensions of the base variables
+        all_base_dims = {}
         for i, data in enumerate(self.iter_data):
-            mask = self.load_mask(data, value)
-            new_data = data.where(mask.astype(bool))
+            base_id = id(data.psy.base)
+            key = (base_id, data.dims)
+            try:
+                source = sources[key]
+            except KeyError:
+                source = sources[key] = self._get_mask_source(data, value)
+            key = (base_id, data.name)
+            try:
+                base_dims = all_base_dims[key]
+            except KeyError:
+                base_dims = all_base_dims[key] = frozenset(
+                    next(data.psy.iter_base_variables).dims
+                )
+            mask = self._align_mask(data, source, base_dims)
+            if mask.dtype.kind != "b":
+                mask = mask.astype(bool)
+            if self._masks_nothing(data, mask):
+                continue
+            new_data = data.where(mask)
             new_data.psy.base = data.psy.base
             new_data.psy.idims = data.psy.idims
             self.set_data(new_data, i)
 
+    @staticmethod
+    def _masks_nothing(data, mask):
+        """Check whether the boolean `mask` leaves `data` unchanged
+
+        This is the case if `mask` is True everywhere and
+        :meth:`xarray.DataArray.where` would neither broadcast, align nor
+        convert `data`. Dask arrays are not checked to keep them lazy."""
+        if data.dtype.kind != "f" or not isinstance(mask.data, np.ndarray):
+            return False
+        sizes = data.sizes
+        if any(sizes.get(dim) != size for dim, size in mask.sizes.items()):
+            return False
+        data_indexes = data.indexes
+        for dim, index in mask.indexes.items():
+            if dim not in data_indexes or not data_indexes[dim].equals(index):
+                return False
+        return bool(mask.values.all())
+
     def diff(self, value):
-        try:
-            return bool(self.value != value)
-        except ValueError:
-            if hasattr(value, "shape") and hasattr(self.value, "shape"):
-                return (value.shape != self.value.shape) | (
-                    value != self.value
-                ).any()
-            else:
+        old = self.value
+        if hasattr(value, "shape") or hasattr(old, "shape"):
+            # compare arrays explicitly to avoid ambiguous truth values
+            if not (hasattr(value, "shape") and hasattr(old, "shape")):
                 return True
+            return not np.array_equal(np.asarray(value), np.asarray(old))
+        return bool(old != value)
 
     def load_mask(self, data, value):
+        """Load the mask for the given `data`
+
+        Parameters
+        ----------
+        data: xarray.DataArray
+            The data to mask
+        value: str or xarray.DataArray
+            The value of this formatoption
+
+        Returns
+        -------
+        xarray.DataArray
+            The mask that matches the dimensions of `data`"""
+        return self._align_mask(data, self._get_mask_source(data, value))
+
+    def _get_mask_source(self, data, value):
+        """Get the mask variable from the base dataset or the mask file
+
+        The result only depends on the base dataset and the dimensions of
+        `data` and can be reused for arrays that share them"""
         if isinstance(value, str) and value in data.psy.base:
             mask = data.psy.base[value]
             if not set(mask.dims).intersection(data.dims):
@@ -1039,8 +1281,16 @@ class Mask(Formatoption):
                     f"{data.dims}"
                 )
         elif isinstance(value, str):
+            path = os.path.abspath(value)
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:  # e.g. a remote dataset
+                mtime = None
             try:
-                mask = open_dataset(value)
+                if mtime is None:
+                    mask = _load_mask_dataset(value)
+                else:
+                    mask = _load_cached_mask_dataset(path, mtime)
             except Exception:
                 raise ValueError(
                     f"{value} is not in the base dataset of "
@@ -1062,10 +1312,18 @@ class Mask(Formatoption):
                     mask = mask[available_vars[0]]
         else:
             mask = value
-        base_var = next(data.psy.iter_base_variables)
+        return mask
+
+    def _align_mask(self, data, mask, base_dims=None):
+        """Aggregate and select the `mask` to match the dimensions of `data`
+
+        `base_dims` are the dimensions of the base variable of `data`. If
+        None, they are taken from the base dataset"""
+        if base_dims is None:
+            base_dims = next(data.psy.iter_base_variables).dims
 
         # aggregate mask over dimensions that are not in the base variable
-        dims2agg = set(mask.dims).difference(set(base_var.dims))
+        dims2agg = set(mask.dims).difference(base_dims)
         if dims2agg:
             mask = mask.any(list(dims2agg))
 
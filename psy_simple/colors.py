@@ -13,14 +13,15 @@ function to visualize available colormaps.
 # SPDX-License-Identifier: LGPL-3.0-only
 
 
+from copy import copy
 from difflib import get_close_matches
+from functools import lru_cache
 from itertools import chain
 from warnings import warn
 
 import matplotlib as mpl
 import numpy as np
 import psyplot
-import six
 from matplotlib.cm import get_cmap as mpl_get_cmap
 from matplotlib.colors import BoundaryNorm, Colormap, LinearSegmentedColormap
 from psyplot import rcParams
@@ -28,65 +29,81 @@ from psyplot.data import safe_list
 from psyplot.docstring import docstrings
 from psyplot.utils import isstring
 
-_cmapnames = {  # names of self defined colormaps (see get_cmap function below)
-    "red_white_blue": [  # symmetric water fluxes
-        (1, 0, 0),
-        (1, 0.5, 0),
-        (1, 1, 0),
-        (1, 1.0, 1),
-        (0, 1, 1),
-        (0, 0.5, 1),
-        (0, 0, 1),
-    ],
-    "blue_white_red": [  # symmetric temperature
-        (0, 0, 1),
-        (0, 0.5, 1),
-        (0, 1, 1),
-        (1, 1.0, 1),
-        (1, 1, 0),
-        (1, 0.5, 0),
-        (1, 0, 0),
-    ],
-    "white_blue_red": [  # temperature
-        (1, 1.0, 1),
-        (0, 0, 1),
-        (0, 1, 1),
-        (1, 1, 0),
-        (1, 0, 0),
-    ],
-    "white_red_blue": [  # water fluxes
-        (1, 1.0, 1),
-        (1, 0, 0),
-        (1, 1, 0),
-        (0, 1, 1),
-        (0, 0, 1),
-    ],
-    "rwb": [(1, 0, 0), (1, 1.0, 1), (0, 0, 1)],
-    "wrb": [(1, 1.0, 1), (1, 0, 0), (0, 0, 1)],
-    "wbr": [(1, 1.0, 1), (0, 0, 1), (1, 0, 0)],
-}
-for key, val in list(_cmapnames.items()):
-    _cmapnames[key + "_r"] = val[::-1]
-
-_color_array = np.linspace(0, 1, 256, endpoint=True)
-
-_cmapnames["w_RdBu"] = np.append(
-    [[1.0, 1.0, 1.0, 1.0]], mpl_get_cmap("RdBu")(_color_array), axis=0
-)
-_cmapnames["w_RdBu_r"] = np.append(
-    [[1.0, 1.0, 1.0, 1.0]], mpl_get_cmap("RdBu_r")(_color_array), axis=0
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    process = None
+
+
+# names of self defined colormaps (see get_cmap function below)
+_cmapnames = dict(
+    (key, np.asarray(val, dtype=np.float32))
+    for key, val in {
+        "red_white_blue": [  # symmetric water fluxes
+            (1, 0, 0),
+            (1, 0.5, 0),
+            (1, 1, 0),
+            (1, 1.0, 1),
+            (0, 1, 1),
+            (0, 0.5, 1),
+            (0, 0, 1),
+        ],
+        "blue_white_red": [  # symmetric temperature
+            (0, 0, 1),
+            (0, 0.5, 1),
+            (0, 1, 1),
+            (1, 1.0, 1),
+            (1, 1, 0),
+            (1, 0.5, 0),
+            (1, 0, 0),
+        ],
+        "white_blue_red": [  # temperature
+            (1, 1.0, 1),
+            (0, 0, 1),
+            (0, 1, 1),
+            (1, 1, 0),
+            (1, 0, 0),
+        ],
+        "white_red_blue": [  # water fluxes
+            (1, 1.0, 1),
+            (1, 0, 0),
+            (1, 1, 0),
+            (0, 1, 1),
+            (0, 0, 1),
+        ],
+        "rwb": [(1, 0, 0), (1, 1.0, 1), (0, 0, 1)],
+        "wrb": [(1, 1.0, 1), (1, 0, 0), (0, 0, 1)],
+        "wbr": [(1, 1.0, 1), (0, 0, 1), (1, 0, 0)],
+    }.items()
 )
 
-_cmapnames["w_Reds"] = np.append(
-    [[1.0, 1.0, 1.0, 1.0]], mpl_get_cmap("Reds")(_color_array), axis=0
-)
+# the reversed color lists are views and do not copy the colors
+_cmapnames.update([(key + "_r", val[::-1]) for key, val in _cmapnames.items()])
 
-_cmapnames["w_Blues"] = np.append(
-    [[1.0, 1.0, 1.0, 1.0]], mpl_get_cmap("Blues")(_color_array), axis=0
-)
+_color_array = np.linspace(0, 1, 256, endpoint=True, dtype=np.float32)
+
+
+def _prepend_white(cmap_name):
+    """Get the colors of a matplotlib colormap with a leading white
 
-_cmapnames["w_Greens"] = np.append(
-    [[1.0, 1.0, 1.0, 1.0]], mpl_get_cmap("Greens")(_color_array), axis=0
+    Parameters
+    ----------
+    cmap_name: str
+        The name of the matplotlib colormap
+
+    Returns
+    -------
+    np.ndarray of shape (257, 4)
+        The white RGBA color followed by the 256 colors of the colormap"""
+    colors = np.empty((len(_color_array) + 1, 4), dtype=np.float32)
+    colors[0] = 1.0
+    colors[1:] = mpl_get_cmap(cmap_name)(_color_array)
+    return colors
+
+
+_cmapnames.update(
+    ("w_" + name, _prepend_white(name))
+    for name in ["RdBu", "RdBu_r", "Reds", "Blues", "Greens"]
 )
 
 
@@ -99,6 +116,11 @@ docstrings.params[
         dictionary (including their reversed color maps given via the '_r'
         extension)."""
 
+#: read-only 0-d NaN array that :meth:`FixedColorMap.__call__` uses for
+#: masked scalars
+_NAN_0D = np.array(np.nan)
+_NAN_0D.setflags(write=False)
+
 
 class FixedColorMap(LinearSegmentedColormap):
     """Bug fixing colormap with same functionality as matplotlibs colormap
@@ -142,19 +164,15 @@ class FixedColorMap(LinearSegmentedColormap):
         ValueError: setting an array element with a sequence.
     """
 
-    if six.PY3:
+    def __call__(self, X, *args, **kwargs):
+        if isinstance(X, np.ma.core.MaskedArray) and X.ndim == 0:
+            X = _NAN_0D
+        return super(FixedColorMap, self).__call__(X, *args, **kwargs)
 
-        def __call__(self, X, *args, **kwargs):
-            if isinstance(X, np.ma.core.MaskedArray) and X.ndim == 0:
-                X = np.array(np.nan)
-            return super(FixedColorMap, self).__call__(X, *args, **kwargs)
-
-        @staticmethod
-        def from_list(*args, **kwargs):
-            cmap = LinearSegmentedColormap.from_list(*args, **kwargs)
-            return FixedColorMap(
-                cmap.name, cmap._segmentdata, cmap.N, cmap._gamma
-            )
+    @staticmethod
+    def from_list(*args, **kwargs):
+        cmap = LinearSegmentedColormap.from_list(*args, **kwargs)
+        return FixedColorMap(cmap.name, cmap._segmentdata, cmap.N, cmap._gamma)
 
 
 class FixedBoundaryNorm(BoundaryNorm):
@@ -204,12 +222,10 @@ class FixedBoundaryNorm(BoundaryNorm):
         MaskError: Cannot convert masked element to a Python int.
     """
 
-    if mpl.__version__ > "1.4":
-
-        def __call__(self, value, clip=None):
-            if isinstance(value, np.ma.core.MaskedConstant):
-                return value
-            return super(FixedBoundaryNorm, self).__call__(value, clip=clip)
+    def __call__(self, value, clip=None):
+        if isinstance(value, np.ma.core.MaskedConstant):
+            return value
+        return super(FixedBoundaryNorm, self).__call__(value, clip=clip)
 
 
 @docstrings.dedent
@@ -242,11 +258,10 @@ def get_cmap(name, lut=None):
     if isstring(name) and name in rcParams["colors.cmaps"]:
         colors = rcParams["colors.cmaps"][name]
         lut = lut or len(colors)
-        return FixedColorMap.from_list(name=name, colors=colors, N=lut)
+        return _from_list(name, colors, lut)
     elif isstring(name) and name in _cmapnames:
-        colors = _cmapnames[name]
-        lut = lut or len(colors)
-        return FixedColorMap.from_list(name=name, colors=colors, N=lut)
+        lut = lut or len(_cmapnames[name])
+        return copy(_get_psyplot_cmap(name, lut))
     else:
         cmap = mpl_get_cmap(name)
         # Note: we could include the `lut` in the call of mpl_get_cmap, but
@@ -260,27 +275,74 @@ def get_cmap(name, lut=None):
         return cmap
 
 
+def _from_list(name, colors, lut):
+    """Create a :class:`FixedColorMap` from a list of colors
+
+    The colormaps are cached for the given `name`, `colors` and `lut`. As
+    colormaps are mutable (e.g. via
+    :meth:`~matplotlib.colors.Colormap.set_bad`), a copy of the cached
+    colormap is returned."""
+    try:
+        key = tuple(c if isstring(c) else tuple(c) for c in colors)
+        hash(key)
+    except TypeError:
+        return FixedColorMap.from_list(name=name, colors=colors, N=lut)
+    return copy(_cached_from_list(name, key, lut))
+
+
+@lru_cache(maxsize=128)
+def _cached_from_list(name, colors, lut):
+    return FixedColorMap.from_list(name=name, colors=colors, N=lut)
+
+
+@lru_cache(maxsize=128)
+def _get_psyplot_cmap(name, lut):
+    """Create one of the colormaps defined in this module (cached)"""
+    return FixedColorMap.from_list(name=name, colors=_cmapnames[name], N=lut)
+
+
+def _close_matches(word, possibilities, n=3, cutoff=0.6):
+    """Get the best matches for `word` in `possibilities`
+
+    This function uses :func:`rapidfuzz.process.extract` if rapidfuzz is
+    installed and falls back to :func:`difflib.get_close_matches` otherwise.
+    The parameters are the same as for :func:`difflib.get_close_matches`"""
+    if process is None:
+        return get_close_matches(word, possibilities, n, cutoff)
+    return [
+        match
+        for match, score, i in process.extract(
+            word,
+            possibilities,
+            scorer=fuzz.ratio,
+            limit=n,
+            score_cutoff=cutoff * 100,
+        )
+    ]
+
+
 def _get_cmaps(names):
     """Filter the given `names` for colormaps"""
-    import matplotlib.pyplot as plt
-
     try:
         builtin_cmaps = mpl.colormaps
     except AttributeError:  # matplotlib <3.6
-        builtin_cmaps = plt.cm.cmap_d
+        from matplotlib.cm import cmap_d as builtin_cmaps
     available_cmaps = list(
         chain(builtin_cmaps, _cmapnames, rcParams["colors.cmaps"])
     )
-    names = safe_list(names)
+    # set for fast membership tests
+    available = set(available_cmaps)
+    cmaps = []
     wrongs = []
-    for arg in (
-        arg
-        for arg in names
-        if (not isinstance(arg, Colormap) and arg not in available_cmaps)
-    ):
-        if isinstance(arg, str):
-            similarkeys = get_close_matches(arg, available_cmaps)
-        if similarkeys != []:
+    for arg in safe_list(names):
+        if isinstance(arg, Colormap) or (isstring(arg) and arg in available):
+            cmaps.append(arg)
+            continue
+        if isstring(arg):
+            similarkeys = _close_matches(arg, available_cmaps)
+        else:
+            similarkeys = []
+        if similarkeys:
             warn(
                 "Colormap %s not found in standard colormaps.\n"
                 "Similar colormaps are %s." % (arg, ", ".join(similarkeys))
@@ -290,11 +352,10 @@ def _get_cmaps(names):
                 "Colormap %s not found in standard colormaps.\n"
                 "Run function without arguments to see all colormaps" % arg
             )
-        names.remove(arg)
         wrongs.append(arg)
-    if not names and not wrongs:
-        names = sorted(m for m in available_cmaps if not m.endswith("_r"))
-    return names
+    if not cmaps and not wrongs:
+        cmaps = sorted(m for m in available_cmaps if not m.endswith("_r"))
+    return cmaps
 
 
 @docstrings.get_sections(base="show_colormaps")
@@ -341,22 +402,26 @@ def show_colormaps(names=[], N=10, show=True, use_qt=None):
     # This example comes from the Cookbook on www.scipy.org.  According to the
     # history, Andrew Straw did the conversion from an old page, but it is
     # unclear who the original author is.
-    a = np.vstack((np.linspace(0, 1, 256).reshape(1, -1)))
+    a = np.linspace(0, 1, 256)
     # Get a list of the colormaps in matplotlib.  Ignore the ones that end with
     # '_r' because these are simply reversed versions of ones that don't end
     # with '_r'
     cmaps = _get_cmaps(names)
-    nargs = len(cmaps) + 1
-    fig = plt.figure(figsize=(5, 10))
+    # scale the height with the number of colormaps, but do not exceed the
+    # height of the full overview
+    fig = plt.figure(figsize=(5, min(10, 0.25 * max(len(cmaps), 1) + 0.2)))
     fig.subplots_adjust(top=0.99, bottom=0.01, left=0.2, right=0.99)
-    for i, m in enumerate(cmaps):
-        ax = plt.subplot(nargs, 1, i + 1)
-        plt.axis("off")
-        plt.pcolormesh(a, cmap=get_cmap(m, N + 1))
-        pos = list(ax.get_position().bounds)
-        fig.text(
-            pos[0] - 0.01, pos[1], m, fontsize=10, horizontalalignment="right"
-        )
+    if cmaps:
+        # draw all colormaps as rows of one image
+        colors = np.stack([get_cmap(m, N + 1)(a) for m in cmaps])
+        ax = fig.add_subplot()
+        ax.imshow(colors, aspect="auto", interpolation="nearest")
+        ax.set_xticks([])
+        ax.set_yticks(range(len(cmaps)))
+        ax.set_yticklabels([getattr(m, "name", m) for m in cmaps], fontsize=10)
+        ax.tick_params(left=False)
+        for spine in ax.spines.values():
+            spine.set_visible(False)
     if show:
         plt.show(block=False)
     return fig
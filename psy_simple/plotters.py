@@ -15,14 +15,19 @@ from warnings import warn
 
 import matplotlib as mpl
 import numpy as np
-import six
 import xarray as xr
 from matplotlib.dates import AutoDateFormatter, DateFormatter
-from matplotlib.ticker import FixedFormatter, FixedLocator, FormatStrFormatter
+from matplotlib.ticker import (
+    FixedFormatter,
+    FixedLocator,
+    FormatStrFormatter,
+    NullLocator,
+)
 from pandas import (
     DatetimeIndex,
     MultiIndex,
     date_range,
+    isnull,
     to_datetime,
     to_timedelta,
 )
@@ -114,22 +119,60 @@ def round_to_05(n, exp=None, mode="s"):
                 -2.50000000e-04])
     """
     n = np.asarray(n)
+    nabs = np.abs(n)
     if exp is None:
-        exp = np.floor(np.log10(np.abs(n)))  # exponent for base 10
-    ntmp = np.abs(n) / 10.0**exp  # mantissa for base 10
+        exp = np.floor(np.log10(nabs))  # exponent for base 10
+    scale = 10.0**exp
+    ntmp = nabs / scale  # mantissa for base 10
     if mode == "s":
         n1 = ntmp
-        s = 1.0
+        s = 0.5
         n2 = nret = np.floor(ntmp)
     else:
         n1 = nret = np.ceil(ntmp)
-        s = -1.0
+        s = -0.5
         n2 = ntmp
-    return np.where(
-        n1 - n2 > 0.5,
-        np.sign(n) * (nret + s * 0.5) * 10.0**exp,
-        np.sign(n) * nret * 10.0**exp,
-    )
+    return np.where(n1 - n2 > 0.5, nret + s, nret) * (np.sign(n) * scale)
+
+
+def round_to_05_pair(n, exp=None):
+    """
+    Round to the next smaller and larger 0.5-value.
+
+    This function is equivalent to
+    ``(round_to_05(n, exp, 's'), round_to_05(n, exp, 'l'))`` but computes the
+    mantissa and the exponent only once.
+
+    Parameters
+    ----------
+    n: numpy.ndarray
+        number to round
+    exp: int or numpy.ndarray
+        Exponent for rounding. If None, it will be computed from `n` to be the
+        exponents for base 10.
+
+    Returns
+    -------
+    numpy.ndarray
+        `n` rounded to the value whose absolute value is below `n`
+    numpy.ndarray
+        `n` rounded to the value whose absolute value is above `n`
+
+    See Also
+    --------
+    round_to_05
+    """
+    n = np.asarray(n)
+    nabs = np.abs(n)
+    if exp is None:
+        exp = np.floor(np.log10(nabs))  # exponent for base 10
+    ntmp = nabs / 10.0**exp  # mantissa for base 10
+    scale = np.sign(n) * 10.0**exp
+    nfloor = np.floor(ntmp)
+    nceil = np.ceil(ntmp)
+    smaller = np.where(ntmp - nfloor > 0.5, nfloor + 0.5, nfloor) * scale
+    larger = np.where(nceil - ntmp > 0.5, nceil - 0.5, nceil) * scale
+    return smaller, larger
 
 
 def convert_radian(coord, *variables):
@@ -234,18 +277,15 @@ class AlternativeXCoord(Formatoption):
     def update(self, value):
         if value is not None:
             for i, da in enumerate(self.data_iterator):
-                self.set_data(self.replace_coord(i), i)
+                self.set_data(self.replace_coord(i, da), i)
 
     def diff(self, value):
         try:
-            return not (
-                (np.shape(value) == np.shape(self.value))
-                and np.all(value == self.value)
-            )
+            return not np.array_equal(value, self.value)
         except TypeError:
             return True
 
-    def replace_coord(self, i):
+    def replace_coord(self, i, da=None):
         """Replace the coordinate for the data array at the given position
 
         Parameters
@@ -253,14 +293,18 @@ class AlternativeXCoord(Formatoption):
         i: int
             The number of the data array in the raw data (if the raw data is
             not an interactive list, use 0)
+        da: xarray.DataArray
+            The `i`-th data array of the :attr:`data_iterator`. If None, it
+            will be taken from the :attr:`data_iterator`
 
         Returns
         xarray.DataArray
             The data array with the replaced coordinate"""
-        da = next(islice(self.data_iterator, i, i + 1))
+        if da is None:
+            da = next(islice(self.data_iterator, i, i + 1))
         name, coord = self.get_alternative_coord(da, i)
         other_coords = {
-            key: da.coords[key] for key in set(da.coords).difference(da.dims)
+            key: val for key, val in da.coords.items() if key not in da.dims
         }
         ret = (
             da.rename({da.dims[-1]: name})
@@ -272,7 +316,8 @@ class AlternativeXCoord(Formatoption):
     def get_alternative_coord(self, da, i):
         if isinstance(self.value, xr.DataArray):
             return self.value.name, self.value.variable
-        alternative_name = next(islice(cycle(slist(self.value)), i, i + 1))
+        names = slist(self.value)
+        alternative_name = names[i % len(names)]
         coord_da = InteractiveList.from_dataset(
             da.psy.base, name=alternative_name, dims=da.psy.idims
         )[0]
@@ -352,20 +397,16 @@ class AxisColor(DictFormatoption):
         return {key: s.get_edgecolor() for key, s in self.ax.spines.items()}
 
     def initialize_plot(self, value):
-        positions = ["right", "left", "bottom", "top"]
+        spines = self.ax.spines
         #: :class:`dict` storing the default linewidths
-        self.default_lw = dict(
-            zip(
-                positions,
-                map(
-                    lambda pos: self.ax.spines[pos].get_linewidth(), positions
-                ),
-            )
-        )
+        self.default_lw = {
+            pos: spines[pos].get_linewidth()
+            for pos in ["right", "left", "bottom", "top"]
+        }
         self.update(value)
 
     def update(self, value):
-        for pos, color in six.iteritems(value):
+        for pos, color in value.items():
             spine = self.ax.spines[pos]
             spine.set_color(color)
             if color is not None and spine.get_linewidth() == 0.0:
@@ -405,11 +446,66 @@ class TicksManager(TicksManagerBase, DictFormatoption):
     group = "ticks"
 
     def update(self, value):
-        for which, val in six.iteritems(value):
+        for which, val in value.items():
             self.which = which
             self.update_axis(val)
 
 
+def _nanmin(arr):
+    """The minimum of `arr`, ignoring NaNs if possible"""
+    try:
+        return np.nanmin(arr)
+    except TypeError:
+        return np.min(arr)
+
+
+def _nanmax(arr):
+    """The maximum of `arr`, ignoring NaNs if possible"""
+    try:
+        return np.nanmax(arr)
+    except TypeError:
+        return np.max(arr)
+
+
+def _sorted_unique(arr):
+    """The same as :func:`numpy.unique` but skips the sorting if `arr` is
+    already sorted (as it is usually the case for coordinates)"""
+    arr = np.ravel(arr)
+    if arr.size < 2:
+        return np.unique(arr)
+    if not (arr[1:] >= arr[:-1]).all():
+        arr = np.sort(arr)
+    return arr[np.r_[True, arr[1:] != arr[:-1]]]
+
+
+def _data_key(data):
+    """Identify the values of `data` for the caches of the formatoptions
+
+    The key consists of the variable of `data`, the memory address and the
+    shape of its values. It is None if `data` does not have a variable.
+
+    Notes
+    -----
+    Changes of the values in place (e.g. ``data.values[:] = 0``) keep the
+    key and are therefore not detected. psyplot replaces the variable when
+    the data is updated, which does invalidate the caches."""
+    variable = getattr(data, "variable", None)
+    if variable is None:
+        return None
+    vals = np.asarray(variable.values)
+    return (variable, vals.__array_interface__["data"], vals.shape)
+
+
+def _same_data_key(key1, key2):
+    """Check whether two keys from :func:`_data_key` match"""
+    return (
+        key1 is not None
+        and key2 is not None
+        and key1[0] is key2[0]
+        and key1[1:] == key2[1:]
+    )
+
+
 @docstrings.get_sections(base="DataTicksCalculator")
 class DataTicksCalculator(Formatoption):
     """
@@ -478,6 +574,13 @@ class DataTicksCalculator(Formatoption):
 
     data_dependent = True
 
+    #: The :func:`_data_key` of the data and the corresponding :attr:`array`
+    _array_cache = None
+
+    #: The :attr:`array`, the arguments and the result of the last call of
+    #: :meth:`_calc_vmin_vmax`
+    _vmin_vmax_cache = None
+
     @property
     def full_array(self):
         """The full array of this and the shared data"""
@@ -487,122 +590,132 @@ class DataTicksCalculator(Formatoption):
 
     @property
     def array(self):
-        """The numpy array of the data"""
+        """The numpy array of the data
+
+        The array is cached until the variable of the data or its values are
+        replaced (psyplot replaces the variable when the data is updated).
+        Changes of the values in place are not detected."""
         data = self.data
-        if not hasattr(data, "notnull"):
-            data = data.to_series()
-        mask = np.asarray(data.notnull())
-        return data.values[mask]
+        key = _data_key(data)
+        cache = self._array_cache
+        if cache and _same_data_key(cache[0], key):
+            return cache[1]
+        vals = np.asarray(getattr(data, "values", data))
+        if vals.dtype.kind == "f":
+            arr = vals[~np.isnan(vals)]
+        else:
+            arr = vals[~isnull(vals)]
+        if key is not None:
+            arr.setflags(write=False)
+            self._array_cache = (key, arr)
+        return arr
 
     def _data_ticks(self, step=None, *args, **kwargs):
         step = step or 1
         """Array of ticks that match exactly the data"""
-        return np.unique(self.array)[::step]
+        return _sorted_unique(self.array)[::step]
 
     def _mid_data_ticks(self, step=None, *args, **kwargs):
         step = step or 1
         """Array of ticks in the middle between the data points"""
-        arr = np.unique(self.array)
+        arr = _sorted_unique(self.array)
         return ((arr[:-1] + arr[1:]) / 2.0)[::step]
 
+    def _iter_arrays(self):
+        """Iterate over the arrays of this and the shared formatoptions"""
+        yield self.array
+        for fmto in self.shared:
+            fmto._lock_children()
+            # do not lock the fmto itself, because this breaks the plotter
+            # update procedure. But make sure, that the dependencies are
+            # locked
+            arr = fmto.array
+            yield arr
+            # release the locks
+            fmto._release_children()
+
     def _collect_array(self, percmin=None, percmax=None):
         """Collect the data from the shared formatoptions (if necessary)."""
 
-        def nanmin(arr):
-            try:
-                return np.nanmin(arr)
-            except TypeError:
-                return arr.min()
-
-        def nanmax(arr):
-            try:
-                return np.nanmax(arr)
-            except TypeError:
-                return arr.max()
-
         def minmax(arr):
-            return [nanmin(arr), nanmax(arr)]
-
-        def shared_arrays():
-            for fmto in self.shared:
-                fmto._lock_children()
-                # do not lock the fmto itself, because this breaks the plotter
-                # update procedure. But make sure, that the dependencies are
-                # locked
-                arr = fmto.array
-                yield arr
-                # release the locks
-                fmto._release_children()
+            return [_nanmin(arr), _nanmax(arr)]
 
         if not self.shared:
             arr = self.array
         else:
             # np.concatenate all arrays if any of the percentiles are required
             if percmin is not None or percmax is not None:
-                arr = np.concatenate(
-                    tuple(chain([self.array], shared_arrays()))
-                )
+                arr = np.concatenate(tuple(self._iter_arrays()))
             # np.concatenate only min and max-values instead of the full arrays
             else:
-                arr = np.concatenate(
-                    tuple(map(minmax, chain([self.array], shared_arrays())))
-                )
+                arr = np.concatenate(tuple(map(minmax, self._iter_arrays())))
         return arr
 
     def _calc_vmin_vmax(
         self, percmin=None, percmax=None, vmin=None, vmax=None
     ):
-        def nanmin(arr):
-            try:
-                return np.nanmin(arr)
-            except TypeError:
-                return arr.min()
-
-        def nanmax(arr):
-            try:
-                return np.nanmax(arr)
-            except TypeError:
-                return arr.max()
-
         if vmin is not None and vmax is not None:
             return vmin, vmax
 
-        percentiles = []
-        arr = self._collect_array(percmin, percmax)
+        # without shared formatoptions, the limits only depend on the array
+        # which is cached as long as the data is not replaced
+        key = (percmin, percmax, vmin, vmax)
+        if not self.shared:
+            data_arr = self.array
+            cache = self._vmin_vmax_cache
+            if cache is not None and cache[0] is data_arr and cache[1] == key:
+                return cache[2]
+
+        use_percmin = vmin is None and bool(percmin)
+        use_percmax = vmax is None and percmax is not None and percmax != 100
         try:
-            if vmin is not None:
-                pass
-            elif not percmin:
-                vmin = nanmin(arr)
+            if use_percmin or use_percmax:
+                arr = self._collect_array(percmin, percmax)
+                if vmin is None and not use_percmin:
+                    vmin = _nanmin(arr)
+                if vmax is None and not use_percmax:
+                    vmax = _nanmax(arr)
             else:
-                percentiles.append(percmin)
-            if vmax is not None:
-                pass
-            elif percmax is None or percmax == 100:
-                vmax = nanmax(arr)
-            else:
-                percentiles.append(percmax)
+                # reduce the arrays one by one instead of concatenating them
+                mins = []
+                maxs = []
+                for arr in self._iter_arrays():
+                    if vmin is None:
+                        mins.append(_nanmin(arr))
+                    if vmax is None:
+                        maxs.append(_nanmax(arr))
+                if vmin is None:
+                    vmin = mins[0] if len(mins) == 1 else _nanmin(mins)
+                if vmax is None:
+                    vmax = maxs[0] if len(maxs) == 1 else _nanmax(maxs)
         except ValueError:
             self.logger.warn(
                 "Cannot calculate minimum and maximum of the data!",
                 exc_info=True,
             )
             return 0, 1
-        if percentiles:
-            percentiles = iter(np.percentile(arr, percentiles))
-            if percmin:
+        if use_percmin or use_percmax:
+            percentiles = iter(
+                np.percentile(
+                    arr,
+                    [percmin] * use_percmin + [percmax] * use_percmax,
+                )
+            )
+            if use_percmin:
                 vmin = next(percentiles)
-            if percmax and percmax < 100:
+            if use_percmax:
                 vmax = next(percentiles)
-        return vmin, vmax
+        ret = vmin, vmax
+        if not self.shared:
+            self._vmin_vmax_cache = (data_arr, key, ret)
+        return ret
 
     @staticmethod
     def _round_min_max(vmin, vmax):
         if vmin == vmax:
             return vmin, vmax
         exp = np.floor(np.log10(abs(vmax - vmin)))
-        larger = round_to_05([vmin, vmax], exp, mode="l")
-        smaller = round_to_05([vmin, vmax], exp, mode="s")
+        smaller, larger = round_to_05_pair([vmin, vmax], exp)
         return min([larger[0], smaller[0]]), max([larger[1], smaller[1]])
 
     def _rounded_ticks(self, N=None, *args, **kwargs):
@@ -613,18 +726,13 @@ class DataTicksCalculator(Formatoption):
         return np.linspace(vmin, vmax, N, endpoint=True)
 
     def _log_bounds(self, expmin, expmax, N):
-        bounds = []
-        for i in range(int(expmax - expmin)):
-            new_vals = np.linspace(
-                1 * 10 ** (expmin + i), 9 * 10 ** (expmin + i), N + 1
-            )[:-1]
-            bounds.extend(new_vals)
-        return bounds
+        exps = expmin + np.arange(int(expmax - expmin))
+        mantissas = np.linspace(1, 9, N + 1)[:-1]
+        return (mantissas * 10.0 ** exps[:, np.newaxis]).ravel()
 
     def _log_ticks(self, symmetric=False, N=None, *args, **kwargs):
         vmin, vmax = self._calc_vmin_vmax(*args, **kwargs)
-        larger = round_to_05([vmin, vmax], mode="l")
-        smaller = round_to_05([vmin, vmax], mode="s")
+        smaller, larger = round_to_05_pair([vmin, vmax])
         vmin, vmax = min([larger[0], smaller[0]]), max([larger[1], smaller[1]])
 
         if symmetric and np.sign(vmin) == np.sign(vmax):
@@ -652,17 +760,17 @@ class DataTicksCalculator(Formatoption):
             expmax0 = np.inf
         else:  # vmin < 0, vmax > 0
             arr = self._collect_array()
-            less0 = arr < 0
-            greater0 = arr > 0
+            less0 = arr[arr < 0]
+            greater0 = arr[arr > 0]
             if not less0.size:
-                vmin0 = round_to_05(arr[arr > 0].min(), mode="s")
+                vmin0 = round_to_05(greater0.min(), mode="s")
                 vmax0 = -vmin0
             elif not greater0.size:
-                vmax0 = round_to_05(arr[arr < 0].max(), mode="l")
+                vmax0 = round_to_05(less0.max(), mode="l")
                 vmin0 = -vmax0
             else:
-                vmin0 = round_to_05(arr[arr > 0].min(), mode="s")
-                vmax0 = round_to_05(arr[arr < 0].max(), mode="l")
+                vmin0 = round_to_05(greater0.min(), mode="s")
+                vmax0 = round_to_05(less0.max(), mode="l")
                 if symmetric:
                     vmin0 = min(-vmax0, vmin0)
                     vmax0 = -vmin0
@@ -684,12 +792,13 @@ class DataTicksCalculator(Formatoption):
                 # we go close to 11 bounds in total
                 N = int(max(np.floor((11 if not symmetric else 12) / dexp), 1))
             if not crossing0:
-                bounds = self._log_bounds(expmin, expmax, N)
-                bounds += [1 * 10**expmax]
+                bounds = np.append(
+                    self._log_bounds(expmin, expmax, N), 1 * 10**expmax
+                )
                 if signs[0] == -1 and signs[1] == -1:
-                    bounds = -np.array(bounds)
+                    bounds = -bounds
             else:
-                bounds_neg = -np.array(self._log_bounds(expmin, expmax0, N))
+                bounds_neg = -self._log_bounds(expmin, expmax0, N)
                 bounds_pos = self._log_bounds(expmin0, expmax, N)
                 bounds = np.unique(
                     np.r_[
@@ -707,12 +816,10 @@ class DataTicksCalculator(Formatoption):
 
     def _roundedsym_ticks(self, N=None, *args, **kwargs):
         N = N or 10
-        vmax = max(
-            map(
-                abs,
-                self._round_min_max(*self._calc_vmin_vmax(*args, **kwargs)),
-            )
+        vmin, vmax = self._round_min_max(
+            *self._calc_vmin_vmax(*args, **kwargs)
         )
+        vmax = max(abs(vmin), abs(vmax))
         vmin = -vmax
         return np.linspace(vmin, vmax, N, endpoint=True)
 
@@ -723,7 +830,8 @@ class DataTicksCalculator(Formatoption):
 
     def _data_symminmax_ticks(self, N=None, *args, **kwargs):
         N = N or 10
-        vmax = max(map(abs, self._calc_vmin_vmax(*args, **kwargs)))
+        vmin, vmax = self._calc_vmin_vmax(*args, **kwargs)
+        vmax = max(abs(vmin), abs(vmax))
         vmin = -vmax
         return np.linspace(vmin, vmax, N, endpoint=True)
 
@@ -776,7 +884,7 @@ class TicksBase(TicksManagerBase, DataTicksCalculator):
             self.set_locator(self.default_locators[which])
         elif isinstance(value, int):
             return self._reduce_ticks(value)
-        elif len(value) and isinstance(value[0], six.string_types):
+        elif len(value) and isinstance(value[0], str):
             return self.set_ticks(self.calc_funcs[value[0]](*value[1:]))
         elif isinstance(value, tuple):
             steps = 11 if len(value) == 2 else value[3]
@@ -850,6 +958,10 @@ class DtTicksBase(TicksBase, TicksManager):
         sym, the second value determines the total number of ticks (defaults to
         11)."""
 
+    #: The :func:`_data_key` of the plotted arrays and the corresponding
+    #: :attr:`plotted_frame`
+    _frame_cache = None
+
     def __init__(self, *args, **kwargs):
         super(DtTicksBase, self).__init__(*args, **kwargs)
         self.calc_funcs.update(
@@ -882,6 +994,39 @@ class DtTicksBase(TicksBase, TicksManager):
         value = value or {"minor": None, "major": None}
         super(DtTicksBase, self).update(value)
 
+    @property
+    def plotted_frame(self):
+        """The plotted data as :class:`pandas.DataFrame` or
+        :class:`pandas.Series`
+
+        The frame is cached until the variables of the plotted data or their
+        values are replaced (psyplot replaces them when the data is updated).
+        Changes of the values in place are not detected."""
+
+        def select_array(arr):
+            if arr.ndim > 1:
+                return arr.psy[0]
+            return arr
+
+        data = getattr(self.plot, "plotted_data", None)
+        if data is None or not len(data):
+            data = super(DtTicksBase, self).data
+        arrays = data if isinstance(data, InteractiveList) else [data]
+        keys = list(map(_data_key, arrays))
+        cache = self._frame_cache
+        if (
+            cache is not None
+            and len(cache[0]) == len(keys)
+            and all(map(_same_data_key, cache[0], keys))
+        ):
+            return cache[1]
+        if isinstance(data, InteractiveList):
+            df = InteractiveList(map(select_array, data)).to_dataframe()
+        else:
+            df = data.to_series()
+        self._frame_cache = (keys, df)
+        return df
+
     @property
     def dtdata(self):
         """The np.unique :attr:`data` as datetime objects"""
@@ -905,9 +1050,7 @@ class DtTicksBase(TicksBase, TicksManager):
                 return
             mindata = data.min() if onset is None else data.min() - onset
             maxdata = data.max() if offset is None else data.max() + offset
-            return date_range(mindata, maxdata, freq=freq)[
-                ::step
-            ].to_pydatetime()
+            return date_range(mindata, maxdata, freq=freq).values[::step]
 
         return func
 
@@ -917,11 +1060,8 @@ class DtTicksBase(TicksBase, TicksManager):
             data = self.dtdata
             if data is None:
                 return
-            data = date_range(
-                data.min(), data.max(), freq=freq
-            ).to_pydatetime()
-            data[:-1] += (data[1:] - data[:-1]) / 2
-            return data[:-1:step]
+            data = date_range(data.min(), data.max(), freq=freq).values
+            return (data[:-1] + (data[1:] - data[:-1]) / 2)[::step]
 
         return func
 
@@ -966,18 +1106,7 @@ class XTicks(DtTicksBase):
 
     @property
     def data(self):
-        def select_array(arr):
-            if arr.ndim > 1:
-                return arr.psy[0]
-            return arr
-
-        data = getattr(self.plot, "plotted_data", super(XTicks, self).data)
-        if not len(data):
-            data = super(XTicks, self).data
-        if isinstance(data, InteractiveList):
-            df = InteractiveList(map(select_array, data)).to_dataframe()
-        else:
-            df = data.to_series()
+        df = self.plotted_frame
         if self.transpose.value:
             return df
         else:
@@ -997,9 +1126,8 @@ class XTicks(DtTicksBase):
         xticks.default_locators = yticks.default_locators
         yticks.default_locators = old_xlocators
         old_xval = self.value
-        with self.plotter.no_validation:
-            self.plotter[self.key] = self.yticks.value
-            self.plotter[self.yticks.key] = old_xval
+        self.plotter[self.key] = self.yticks.value
+        self.plotter[self.yticks.key] = old_xval
 
 
 class YTicks(DtTicksBase):
@@ -1025,18 +1153,7 @@ class YTicks(DtTicksBase):
 
     @property
     def data(self):
-        def select_array(arr):
-            if arr.ndim > 1:
-                return arr.psy[0]
-            return arr
-
-        data = getattr(self.plot, "plotted_data", super(XTicks, self).data)
-        if not len(data):
-            data = super(XTicks, self).data
-        if isinstance(data, InteractiveList):
-            df = InteractiveList(map(select_array, data)).to_dataframe()
-        else:
-            df = data.to_series()
+        df = self.plotted_frame
         if self.transpose.value:
             if isinstance(df.index, MultiIndex) and len(df.index.names) == 1:
                 return df.index.get_level_values(0)
@@ -1079,7 +1196,7 @@ class TickLabelsBase(TicksManagerBase):
     def update_axis(self, value):
         if value is None:
             self.set_formatter(self.default_formatters["major"])
-        elif isinstance(value, six.string_types):
+        elif isinstance(value, str):
             self.set_stringformatter(value)
         else:
             ticks = self.axis.get_ticklocs(minor=self.which == "minor")
@@ -1114,15 +1231,15 @@ class TickLabelsBase(TicksManagerBase):
 
 class TickLabels(TickLabelsBase, TicksManager):
     def update(self, value):
+        # reset the minor ticklabels if only the minor ticks are set. Our own
+        # value is checked first to avoid the lookup of the ticks
         if (
-            getattr(self, self.key.replace("label", "")).value.get("minor")
+            "minor" not in self.value
+            and getattr(self, self.key.replace("label", "")).value.get("minor")
             is not None
-            and "minor" not in self.value
         ):
-            items = chain(six.iteritems(value), [("minor", None)])
-        else:
-            items = six.iteritems(value)
-        super(TickLabels, self).update(dict(items))
+            value = dict(value, minor=None)
+        super(TickLabels, self).update(value)
 
     def set_default_formatters(self, which=None):
         """Sets the default formatters that is used for updating to None
@@ -1173,9 +1290,8 @@ class XTickLabels(TickLabels):
         xticklabels.default_formatters = yticklabels.default_formatters
         yticklabels.default_formatters = old_xformatters
         old_xval = self.value
-        with self.plotter.no_validation:
-            self.plotter[self.key] = self.yticklabels.value
-            self.plotter[self.yticklabels.key] = old_xval
+        self.plotter[self.key] = self.yticklabels.value
+        self.plotter[self.yticklabels.key] = old_xval
 
 
 class YTickLabels(TickLabels):
@@ -1200,6 +1316,26 @@ class YTickLabels(TickLabels):
         return self.ax.yaxis
 
 
+def _stacked_ticks_array(df):
+    """Get the lower bound and the stacked bar heights of a data frame
+
+    The row sums (ignoring NaNs) are written into a preallocated array
+    behind the minimum of 0 and the smallest value in `df`"""
+    vals = df.values
+    ret = np.empty(len(vals) + 1, dtype=np.result_type(vals.dtype, int))
+    np.nansum(vals, axis=1, out=ret[1:])
+    ret[0] = min(0, vals.min())
+    return ret
+
+
+def _unique_positions(arr):
+    """Get the sorted unique positions of categorical bars
+
+    The positions are non-negative integers, so we count them instead of
+    sorting them as :func:`numpy.unique` would do"""
+    return np.flatnonzero(np.bincount(arr.astype(np.intp, copy=False)))
+
+
 class BarXTicks(XTicks):
     __doc__ = XTicks.__doc__
 
@@ -1207,16 +1343,20 @@ class BarXTicks(XTicks):
 
     dependencies = XTicks.dependencies + ["categorical"]
 
-    def update(self, value):
-        import matplotlib.ticker as mtick
+    #: The copy of the original default locators that is currently in use
+    _restored_locators = None
 
+    def update(self, value):
         if self.categorical.is_categorical and not self.transpose.value:
-            self.default_locators["major"] = mtick.FixedLocator(
-                np.unique(self.array)
+            self.default_locators["major"] = FixedLocator(
+                _unique_positions(self.array)
             )
-            self.default_locators["minor"] = mtick.NullLocator()
-        else:
+            self.default_locators["minor"] = NullLocator()
+            self._restored_locators = None
+        elif self.default_locators is not self._restored_locators:
+            # the locators have been modified or swapped
             self.default_locators = self._orig_default_locators.copy()
+            self._restored_locators = self.default_locators
         return super(BarXTicks, self).update(value)
 
     def set_default_locators(self):
@@ -1226,14 +1366,10 @@ class BarXTicks(XTicks):
     @property
     def array(self):
         if self.transpose.value and "stacked" in slist(self.plot.value):
-            df = self.data.to_dataframe()
-            return np.concatenate(
-                [[min([0, df.values.min()])], df.sum(axis=1).values]
-            )
+            return _stacked_ticks_array(self.plotted_frame)
         elif self.transpose.value:
-            return np.concatenate(
-                [self.plot.get_xys(arr)[1] for arr in self.plot.iter_data]
-            )
+            # the bar heights are simply the data values
+            return np.concatenate([arr.values for arr in self.plot.iter_data])
         else:
             return np.concatenate(
                 [self.plot.get_xys(arr)[0] for arr in self.plot.iter_data]
@@ -1247,16 +1383,20 @@ class BarYTicks(YTicks):
 
     dependencies = YTicks.dependencies + ["categorical"]
 
-    def update(self, value):
-        import matplotlib.ticker as mtick
+    #: The copy of the original default locators that is currently in use
+    _restored_locators = None
 
+    def update(self, value):
         if self.categorical.is_categorical and self.transpose.value:
-            self.default_locators["major"] = mtick.FixedLocator(
-                np.unique(self.array)
+            self.default_locators["major"] = FixedLocator(
+                _unique_positions(self.array)
             )
-            self.default_locators["minor"] = mtick.NullLocator()
-        else:
+            self.default_locators["minor"] = NullLocator()
+            self._restored_locators = None
+        elif self.default_locators is not self._restored_locators:
+            # the locators have been modified or swapped
             self.default_locators = self._orig_default_locators.copy()
+            self._restored_locators = self.default_locators
         return super(BarYTicks, self).update(value)
 
     def set_default_locators(self):
@@ -1266,18 +1406,14 @@ class BarYTicks(YTicks):
     @property
     def array(self):
         if not self.transpose.value and "stacked" in slist(self.plot.value):
-            df = self.data.to_dataframe()
-            return np.concatenate(
-                [[min([0, df.values.min()])], df.sum(axis=1).values]
-            )
+            return _stacked_ticks_array(self.plotted_frame)
         elif self.transpose.value:
             return np.concatenate(
                 [self.plot.get_xys(arr)[0] for arr in self.plot.iter_data]
             )
         else:
-            return np.concatenate(
-                [self.plot.get_xys(arr)[1] for arr in self.plot.iter_data]
-            )
+            # the bar heights are simply the data values
+            return np.concatenate([arr.values for arr in self.plot.iter_data])
 
 
 class BarXTickLabels(XTickLabels):
@@ -1287,17 +1423,13 @@ class BarXTickLabels(XTickLabels):
 
     def set_stringformatter(self, s):
         if not self.transpose.value and self.plot.value is not None:
-            index = self.data.to_dataframe().index
+            index = self.xticks.plotted_frame.index
             if isinstance(index, DatetimeIndex):
                 if self.categorical.is_categorical:
                     xticks = self.ax.get_xticks(minor=self.which == "minor")
-                    arr = list(
-                        map(
-                            lambda t: t.toordinal(),
-                            to_datetime(index[xticks.astype(int)]),
-                        )
+                    self.ax.set_xticklabels(
+                        index[xticks.astype(int)].strftime(s).tolist()
                     )
-                    self.ax.set_xticklabels(list(map(DateFormatter(s), arr)))
                 else:
                     self.set_formatter(DateFormatter(s))
                 return
@@ -1311,17 +1443,13 @@ class BarYTickLabels(YTickLabels):
 
     def set_stringformatter(self, s):
         if self.transpose.value and self.plot.value is not None:
-            index = self.data.to_dataframe().index
+            index = self.yticks.plotted_frame.index
             if isinstance(index, DatetimeIndex):
                 if self.categorical.is_categorical:
-                    yticks = self.ax.get_yticks(self.which == "minor")
-                    arr = list(
-                        map(
-                            lambda t: t.toordinal(),
-                            to_datetime(index[yticks.astype(int)]),
-                        )
+                    yticks = self.ax.get_yticks(minor=self.which == "minor")
+                    self.ax.set_yticklabels(
+                        index[yticks.astype(int)].strftime(s).tolist()
                     )
-                    self.ax.set_yticklabels(list(map(DateFormatter(s), arr)))
                 else:
                     self.set_formatter(DateFormatter(s))
                 return
@@ -1332,7 +1460,7 @@ class TicksOptions(TicksManagerBase):
     """Base class for ticklabels options that apply for x- and y-axis"""
 
     def update(self, value):
-        for which, val in six.iteritems(value):
+        for which, val in value.items():
             for axis, axisname in zip([self.ax.xaxis, self.ax.yaxis], "xy"):
                 self.which = which
                 self.axis = axis
@@ -1410,7 +1538,7 @@ class TickPropsBase(TicksManagerBase):
 
     def update_axis(self, value):
         value = value.copy()
-        if float(".".join(mpl.__version__.split(".")[:2])) >= 1.5:
+        if mpl_version >= 1.5:
             value.pop("visible", None)
         self.ax.tick_params(
             self.axisname, which=self.which, reset=True, **value
@@ -1464,7 +1592,7 @@ class YTickProps(XTickProps):
 
     @property
     def axis(self):
-        return self.ax.xaxis
+        return self.ax.yaxis
 
 
 @docstrings.get_sections(base="Xlabel")
@@ -1490,35 +1618,31 @@ class Xlabel(TextBase, Formatoption):
 
     @property
     def enhanced_attrs(self):
-        arr = self.transpose.get_x(self.data)
-        replot = self.plotter.replot or not hasattr(self, "_enhanced_attrs")
-        attrs = self.get_enhanced_attrs(arr, replot=replot)
-        arr_attrs = self.get_enhanced_attrs(self.data, replot=replot)
-        for attr, val in arr_attrs.items():
+        if hasattr(self, "_enhanced_attrs") and not self.plotter.replot:
+            return self._enhanced_attrs
+        get_attrs = self.plotter.get_enhanced_attrs
+        attrs = get_attrs(self.transpose.get_x(self.data))
+        for attr, val in get_attrs(self.data).items():
             attrs.setdefault(attr, val)
         self._enhanced_attrs = attrs
         return attrs
 
     def initialize_plot(self, value):
         self.transpose.swap_funcs["labels"] = self._swap_labels
-        self._texts = [
-            self.ax.set_xlabel(
-                self.replace(value, self.data, self.enhanced_attrs)
-            )
-        ]
+        self._texts = [self.ax.set_xlabel(self._get_label(value))]
 
     def update(self, value):
-        self._texts[0].set_text(
-            self.replace(value, self.data, self.enhanced_attrs)
-        )
+        self._texts[0].set_text(self._get_label(value))
+
+    def _get_label(self, value):
+        return self.replace(value, self.data, self._get_attrs_for(value))
 
     def _swap_labels(self):
         plotter = self.plotter
         self.transpose._swap_labels()
         old_xlabel = self.value
-        with plotter.no_validation:
-            plotter[self.key] = self.ylabel.value
-            plotter[self.ylabel.key] = old_xlabel
+        plotter[self.key] = self.ylabel.value
+        plotter[self.ylabel.key] = old_xlabel
 
 
 class BarXlabel(Xlabel):
@@ -1564,26 +1688,23 @@ class Ylabel(TextBase, Formatoption):
 
     @property
     def enhanced_attrs(self):
-        arr = self.transpose.get_y(self.data)
-        replot = self.plotter.replot or not hasattr(self, "_enhanced_attrs")
-        attrs = self.get_enhanced_attrs(arr, replot=replot)
-        arr_attrs = self.get_enhanced_attrs(self.data, replot=replot)
-        for attr, val in arr_attrs.items():
+        if hasattr(self, "_enhanced_attrs") and not self.plotter.replot:
+            return self._enhanced_attrs
+        get_attrs = self.plotter.get_enhanced_attrs
+        attrs = get_attrs(self.transpose.get_y(self.data))
+        for attr, val in get_attrs(self.data).items():
             attrs.setdefault(attr, val)
         self._enhanced_attrs = attrs
         return attrs
 
     def initialize_plot(self, value):
-        self._texts = [
-            self.ax.set_ylabel(
-                self.replace(value, self.data, self.enhanced_attrs)
-            )
-        ]
+        self._texts = [self.ax.set_ylabel(self._get_label(value))]
 
     def update(self, value):
-        self._texts[0].set_text(
-            self.replace(value, self.data, self.enhanced_attrs)
-        )
+        self._texts[0].set_text(self._get_label(value))
+
+    def _get_label(self, value):
+        return self.replace(value, self.data, self._get_attrs_for(value))
 
 
 class BarYlabel(Ylabel):
@@ -1740,8 +1861,11 @@ class Transpose(Formatoption):
         pass
 
     def update(self, value):
-        for func in six.itervalues(self.swap_funcs):
-            func()
+        # the swap functions may set the plotter values of the x- and
+        # y-formatoptions without validation
+        with self.plotter.no_validation:
+            for func in self.swap_funcs.values():
+                func()
 
     def _swap_ticks(self):
         xaxis = self.ax.xaxis
@@ -1884,6 +2008,8 @@ class LineColors(Formatoption):
 
     def update(self, value):
         changed = self.plotter.has_changed(self.key)
+        data = self.data
+        n = len(data) if isinstance(data, InteractiveList) else 1
         if value is None:
             prop_cycler = mpl.rcParams["axes.prop_cycle"]
             self.color_cycle = cycle((props["color"] for props in prop_cycler))
@@ -1891,11 +2017,7 @@ class LineColors(Formatoption):
         else:
             try:
                 self.color_cycle = cycle(
-                    get_cmap(value)(
-                        np.linspace(
-                            0.0, 1.0, len(list(self.iter_data)), endpoint=True
-                        )
-                    )
+                    get_cmap(value)(np.linspace(0.0, 1.0, n, endpoint=True))
                 )
             except (ValueError, TypeError, KeyError):
                 try:
@@ -1907,7 +2029,10 @@ class LineColors(Formatoption):
                     value = [value]
                 self.color_cycle = cycle(iter(value))
         if changed:
-            self.colors.clear()
+            # draw the colors for the plotted arrays at once. The cycle is
+            # advanced accordingly such that :attr:`extended_colors` only
+            # needs to fall back to it for additional arrays
+            self.colors[:] = islice(self.color_cycle, n)
 
 
 class Marker(Formatoption):
@@ -1926,10 +2051,11 @@ class Marker(Formatoption):
     priority = BEFOREPLOTTING
 
     def update(self, value):
+        #: The list of markers to cycle through for the plotted arrays
         if value is None:
-            self.markers = repeat(mpl.rcParams["lines.marker"])
+            self.markers = [mpl.rcParams["lines.marker"]]
         else:
-            self.markers = cycle(value)
+            self.markers = list(value)
 
 
 class MarkerSize(Formatoption):
@@ -2038,7 +2164,7 @@ class LinePlot(Formatoption):
                 self._stacked_plot()
             else:
                 try:
-                    markers = self.marker.markers
+                    markers = cycle(self.marker.markers)
                 except AttributeError:
                     markers = repeat(None)
                 self._plot = list(
@@ -2245,7 +2371,7 @@ class ErrorPlot(Formatoption):
                 min_range,
                 max_range,
                 facecolor=c,
-                **dict(chain(*map(six.iteritems, [self._kwargs, kwargs]))),
+                **dict(chain(self._kwargs.items(), kwargs.items())),
             )
         )
 
@@ -2529,7 +2655,7 @@ class ViolinXTickLabels(XTickLabels, TextBase):
     def update_axis(self, value):
         if self.transpose.value or value is None:
             return super(ViolinXTickLabels, self).update_axis(value)
-        if isinstance(value, six.string_types):
+        if isinstance(value, str):
             self.set_ticklabels(
                 [
                     self.replace(
@@ -2557,7 +2683,7 @@ class ViolinYTickLabels(YTickLabels, TextBase):
     def update_axis(self, value):
         if self.transpose.value or value is None:
             return super(ViolinYTickLabels, self).update_axis(value)
-        if isinstance(value, six.string_types):
+        if isinstance(value, str):
             self.set_ticklabels(
                 [
                     self.replace(
@@ -2710,8 +2836,7 @@ class LimitBase(DataTicksCalculator):
     def _round_min_max(self, vmin, vmax):
         try:
             exp = np.floor(np.log10(abs(vmax - vmin)))
-            larger = round_to_05([vmin, vmax], exp, mode="l")
-            smaller = round_to_05([vmin, vmax], exp, mode="s")
+            smaller, larger = round_to_05_pair([vmin, vmax], exp)
         except TypeError:
             self.logger.debug(
                 "Failed to calculate rounded limits!", exc_info=True
@@ -2723,7 +2848,8 @@ class LimitBase(DataTicksCalculator):
         return vmin, vmax
 
     def _roundedsym_min_max(self, vmin, vmax):
-        vmax = max(map(abs, self._round_min_max(vmin, vmax)))
+        vmin, vmax = self._round_min_max(vmin, vmax)
+        vmax = max(abs(vmin), abs(vmax))
         return -vmax, vmax
 
     def _sym_min_max(self, vmin, vmax):
@@ -2817,9 +2943,8 @@ class Xlim(LimitBase):
     def _swap_limits(self):
         self.transpose._swap_limits()
         old_xlim = self.value
-        with self.plotter.no_validation:
-            self.plotter[self.key] = self.ylim.value
-            self.plotter[self.ylim.key] = old_xlim
+        self.plotter[self.key] = self.ylim.value
+        self.plotter[self.ylim.key] = old_xlim
 
 
 class Ylim(LimitBase):
@@ -3309,7 +3434,7 @@ class Bounds(DataTicksCalculator):
             self.norm = value
             self.bounds = [0]
         else:
-            if isinstance(value[0], six.string_types):
+            if isinstance(value[0], str):
                 value = self.calc_funcs[value[0]](*value[1:])
             if value[0] == value[-1]:
                 # make sure we have a small difference between the values
@@ -4110,7 +4235,7 @@ class Cbar(Formatoption):
     def init_kwargs(self):
         return dict(
             chain(
-                six.iteritems(super(Cbar, self).init_kwargs),
+                super(Cbar, self).init_kwargs.items(),
                 [("other_cbars", self.other_cbars)],
             )
         )
@@ -4213,7 +4338,7 @@ class Cbar(Formatoption):
             if self.plot.value is not None:
                 self.draw_colorbar(pos)
         plotter._figs2draw.update(
-            map(lambda cbar: cbar.ax.get_figure(), six.itervalues(self.cbars))
+            map(lambda cbar: cbar.ax.get_figure(), self.cbars.values())
         )
 
     def update_colorbar(self, pos):
@@ -4349,7 +4474,7 @@ class Cbar(Formatoption):
                     [0.125, 0.825, 0.775, 0.05],
                     label=self.raw_data.psy.arr_name + "_ft",
                 )
-        if float(".".join(mpl.__version__.split(".")[:2])) <= 3.2:
+        if mpl_version <= 3.2:
             kwargs["extend"] = self.extend.value
         if "location" not in kwargs:
             kwargs["orientation"] = orientation
@@ -4437,7 +4562,7 @@ class CLabel(TextBase, Formatoption):
     def update(self, value):
         arr = self.plot.data
         self.texts = []
-        for pos, cbar in six.iteritems(self.cbar.cbars):
+        for pos, cbar in self.cbar.cbars.items():
             cbar.set_label(
                 self.replace(value, arr, attrs=self.get_enhanced_attrs(arr))
             )
@@ -4481,7 +4606,7 @@ class CbarOptions(Formatoption):
             return self._colorbar
         except AttributeError:
             try:
-                pos, cbar = next(six.iteritems(self.cbar.cbars))
+                pos, cbar = next(iter(self.cbar.cbars.items()))
             except StopIteration:
                 raise AttributeError("No colorbar set")
             self.position = pos
@@ -4514,7 +4639,7 @@ class CbarOptions(Formatoption):
     axis_locations = CLabel.axis_locations
 
     def update(self, value):
-        for pos, cbar in six.iteritems(self.cbar.cbars):
+        for pos, cbar in self.cbar.cbars.items():
             self.colorbar = cbar
             self.position = pos
             self.update_axis(value)
@@ -4752,7 +4877,7 @@ class CTickProps(CbarOptions, TickPropsBase):
         ):
             value.setdefault(key.split(".")[-1], val)
 
-        if float(".".join(mpl.__version__.split(".")[:2])) >= 1.5:
+        if mpl_version >= 1.5:
             value.pop("visible", None)
         posnames = (
             ["top", "bottom"] if self.axisname == "x" else ["left", "right"]
@@ -4921,7 +5046,7 @@ class VectorLineWidth(VectorCalculator):
             self.plot._kwargs["linewidth"] = (
                 0 if self.plot.value == "quiver" else None
             )
-        elif np.asarray(value).ndim and isinstance(value[0], six.string_types):
+        elif np.asarray(value).ndim and isinstance(value[0], str):
             self.plot._kwargs["linewidth"] = self._calc_funcs[value[0]](
                 *value[1:]
             )
@@ -4965,10 +5090,7 @@ class VectorColor(VectorCalculator):
             value = validate_color(value)
             self.colored = False
         except ValueError:
-            if (
-                isinstance(value, six.string_types)
-                and value in self._calc_funcs
-            ):
+            if isinstance(value, str) and value in self._calc_funcs:
                 value = self._calc_funcs[value]()
                 self.colored = True
                 self._color_array = value
@@ -5416,7 +5538,7 @@ class LegendLabels(Formatoption, TextBase):
                 return arr[0]
             return arr
 
-        if isinstance(value, six.string_types):
+        if isinstance(value, str):
             self.labels = [
                 self.replace(
                     value,
@@ -5950,7 +6072,7 @@ class PointDensity(Formatoption):
         import statsmodels.nonparametric.api as smnp
 
         for i, (coord, bw) in enumerate(zip([x, y], bws)):
-            if isinstance(bw, six.string_types):
+            if isinstance(bw, str):
                 bw_func = getattr(smnp.bandwidths, "bw_" + bw)
                 bws[i] = bw_func(coord)
         kde = smnp.KDEMultivariate([x, y], "cc", bws)
@@ -6103,7 +6225,7 @@ class SimplePlotterBase(BasePlotter, XYTickPlotter):
         -------
         %(Plotter.check_data.returns)s
         """
-        if isinstance(name, six.string_types) or not is_iterable(name):
+        if isinstance(name, str) or not is_iterable(name):
             name = [name]
             dims = [dims]
         N = len(name)
@@ -6218,7 +6340,7 @@ class Simple2DBase(Base2D):
         -------
         %(Plotter.check_data.returns)s
         """
-        if isinstance(name, six.string_types) or not is_iterable(name):
+        if isinstance(name, str) or not is_iterable(name):
             name = [name]
             dims = [dims]
             is_unstructured = [is_unstructured]
@@ -6356,7 +6478,7 @@ class BaseVectorPlotter(Base2D):
         -------
         %(Plotter.check_data.returns)s
         """
-        if isinstance(name, six.string_types) or not is_iterable(name):
+        if isinstance(name, str) or not is_iterable(name):
             name = [name]
             dims = [dims]
             is_unstructured = [is_unstructured]
@@ -6529,7 +6651,7 @@ class CombinedBase(ScalarCombinedBase):
         -------
         %(Plotter.check_data.returns)s
         """
-        if isinstance(name, six.string_types) or not is_iterable(name):
+        if isinstance(name, str) or not is_iterable(name):
             name = [name]
             dims = [dims]
             is_unstructured = [is_unstructured]
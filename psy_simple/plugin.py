@@ -39,10 +39,10 @@ from psyplot.config.rcsetup import (
     validate_stringset,
 )
 
-from psy_simple import __version__ as plugin_version
-
 
 def get_versions(requirements=True):
+    from psy_simple import __version__ as plugin_version
+
     return {"version": plugin_version}
 
 
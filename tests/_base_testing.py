@@ -8,9 +8,8 @@
 
 
 import os
-import subprocess as spr
-import sys
 import time
+from importlib.metadata import PackageNotFoundError, version
 from unittest import TestCase
 
 import numpy as np
@@ -28,13 +27,9 @@ output_dir = os.getenv(
 # it), due to https://github.com/mwaskom/seaborn/issues/966
 # If so, disable the import of it when import psyplot.project
 try:
-    sns_version = spr.check_output(
-        [sys.executable, "-c", "import seaborn; print(seaborn.__version__)"]
-    )
-except spr.CalledProcessError:  # seaborn is not installed
+    sns_version = version("seaborn")
+except PackageNotFoundError:  # seaborn is not installed
     sns_version = None
-else:
-    sns_version = sns_version.decode("utf-8")
 
 
 class PsyPlotTestCase(TestCase):
@@ -124,6 +124,17 @@ class BarPlotterTest(tl.LinePlotterTest):
         self.assertListEqual(
             ax.get_xticks().astype(int).tolist(), list(range(5))
         )
+        ax.figure.canvas.draw()
+        self.assertListEqual(
+            [t.get_text() for t in ax.get_xticklabels()],
+            ["01", "02", "03", "04", "05"],
+        )
+        plotter.update(transpose=True)
+        ax.figure.canvas.draw()
+        self.assertListEqual(
+            [t.get_text() for t in ax.get_yticklabels()],
+            ["01", "02", "03", "04", "05"],
+        )
 
     def test_color(self):
         colors = ["y", "g"][: len(self.data)]
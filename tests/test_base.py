@@ -8,6 +8,8 @@
 # SPDX-License-Identifier: LGPL-3.0-only
 
 
+import os
+import tempfile
 import unittest
 from itertools import chain
 
@@ -91,10 +93,22 @@ class BasePlotterTest(bt.PsyPlotTestCase):
         self.assertEqual(get_title().get_weight(), bold)
         self.assertEqual(get_title().get_ha(), "left")
 
+    def test_title_labels(self):
+        """Test the title with a label that inserts meta attributes"""
+        self.update(title="{desc}")
+        title = self.plotter.ax.title.get_text()
+        self.assertNotIn("%(long_name)s", title)
+
     def test_background(self):
         self.update(background="0.5")
         bc = mcol.to_rgba(self.plotter.ax.patch.get_facecolor())
         self.assertEqual(bc, (0.5, 0.5, 0.5, 1.0))
+        self.update(background=None)
+        bc = mcol.to_rgba(self.plotter.ax.patch.get_facecolor())
+        self.assertEqual(bc, (0.0, 0.0, 0.0, 0.0))
+        self.update(background="rc")
+        bc = mcol.to_rgba(self.plotter.ax.patch.get_facecolor())
+        self.assertEqual(bc, mcol.to_rgba(plt.rcParams["axes.facecolor"]))
 
     def test_figtitle(self):
         """Test figtitle, figtitlesize, figtitleweight, figtitleprops
@@ -116,11 +130,24 @@ class BasePlotterTest(bt.PsyPlotTestCase):
         self.assertEqual(get_figtitle().get_weight(), bold)
         self.assertEqual(get_figtitle().get_ha(), "left")
 
+    def test_figtitle_clear_other_texts(self):
+        """Test that the figtitle clears other texts at its position"""
+        fig = self.plotter.ax.get_figure()
+        other = fig.text(0.5, 0.98, "other")
+        try:
+            self.update(figtitle="Test")
+            self.assertEqual(other.get_text(), "")
+            self.assertEqual(fig._suptitle.get_text(), "Test")
+        finally:
+            other.remove()
+
     def test_text(self):
         """Test text formatoption"""
 
         def get_default_text():
-            for text in chain(*self.plotter.text._texts.values()):
+            for text in chain.from_iterable(
+                texts.values() for texts in self.plotter.text._texts.values()
+            ):
                 if text.get_position() == tuple(
                     psyplot.rcParams["texts.default_position"]
                 ):
@@ -128,18 +155,82 @@ class BasePlotterTest(bt.PsyPlotTestCase):
 
         self._label_test("text", get_default_text)
         self.update(text=(0.5, 0.5, "%(name)s", "fig", {"fontsize": 16}))
-        for t in self.plotter.text._texts["fig"]:
-            if t.get_position() == (0.5, 0.5):
-                text = t
-                break
-            else:
-                text = False
+        text = self.plotter.text._texts["fig"].get((0.5, 0.5), False)
         self.assertTrue(text is not False)
         if not text:
             return
         self.assertEqual(text.get_text(), getattr(self.data, "name", self.var))
         self.assertEqual(text.get_fontsize(), 16)
 
+    def test_text_replot_literal(self):
+        """Test the attributes of a text after a replot with literal texts"""
+        fmto = self.plotter.text
+        if "t" not in fmto.get_enhanced_attrs(self.plotter.data, replot=True):
+            self.skipTest("No time information")
+        pos = (0.5, 0.5)
+        self.update(text=pos + ("%(t)s", "axes", {}))
+        old = fmto._texts["axes"][pos].get_text()
+        self.update(text=pos + ("literal", "axes", {}))
+        self.plotter.data.psy.update(t=2)
+        self.update(text=pos + ("%(t)s", "axes", {}))
+        ref = fmto.replace(
+            "%(t)s",
+            self.plotter.data,
+            fmto.get_enhanced_attrs(fmto.data, replot=True),
+        )
+        self.assertNotEqual(ref, old)
+        self.assertEqual(fmto._texts["axes"][pos].get_text(), ref)
+
+    def test_text_update_remove(self):
+        """Test updating and removing single texts of the text formatoption"""
+        self.update(
+            text=[
+                (0.1, 0.1, "first", "axes", {}),
+                (0.2, 0.2, "second", "axes", {}),
+            ]
+        )
+        self.update(
+            text=[
+                (0.1, 0.1, "", "axes", {}),
+                (0.2, 0.2, "changed", "axes", {}),
+            ]
+        )
+        self.assertEqual(
+            [t[:4] for t in self.plotter.text.value],
+            [(0.2, 0.2, "changed", "axes")],
+        )
+        texts = {
+            t.get_position(): t.get_text()
+            for texts in self.plotter.text._texts.values()
+            for t in texts.values()
+        }
+        self.assertNotIn((0.1, 0.1), texts)
+        self.assertEqual(texts[(0.2, 0.2)], "changed")
+
+    def test_safe_modulo(self):
+        """Test the compiled modulo operation for the labels"""
+        from psyplot.docstring import safe_modulo
+
+        from psy_simple.base import _safe_modulo
+
+        attrs = {"long_name": "Temperature", "units": "K", "x": 1.5}
+        for s in [
+            "%Y-%m-%d %H:%M of %(long_name)s",
+            "%(x)5.2f %% %(units)s",
+            "%(missing)s in %(units)s",
+            "%s of %(long_name)s",
+            "100%",
+        ]:
+            self.assertEqual(_safe_modulo(s, attrs), safe_modulo(s, attrs))
+
+    def test_replace_attr_types(self):
+        """Test the replacement of attributes that compare equal"""
+        fmto = self.plotter.title
+        for val in [1, True, 1.0]:
+            self.assertEqual(
+                fmto.replace("%(a)s", self.data, {"a": val}), str(val)
+            )
+
     def test_maskgreater(self):
         """Test maskgreater formatoption"""
         self.update(maskgreater=self.masking_val)
@@ -176,6 +267,71 @@ class BasePlotterTest(bt.PsyPlotTestCase):
                 data[data > self.masking_val].max(), self.masking_val + 1
             )
 
+    def test_mask_diff(self):
+        """Test the comparison of mask values"""
+        fmto = self.plotter.mask
+        self.assertIsNone(fmto.value)
+        self.assertFalse(fmto.diff(None))
+        self.assertTrue(fmto.diff("t2m"))
+        self.assertTrue(fmto.diff(np.zeros(3)))
+
+    def test_mask_nothing(self):
+        """Test the detection of masks that do not change the data"""
+        fmto = self.plotter.mask
+        for data in fmto.iter_data:
+            mask = data.copy(data=np.ones(data.shape, dtype=bool))
+            self.assertTrue(fmto._masks_nothing(data, mask))
+            mask.values.flat[0] = False
+            self.assertFalse(fmto._masks_nothing(data, mask))
+            mask = mask.isel({mask.dims[-1]: slice(1, None)})
+            mask[:] = True
+            self.assertFalse(fmto._masks_nothing(data, mask))
+
+    def test_mask_file_cache(self):
+        """Test the caching of mask files"""
+        fmto = self.plotter.mask
+        data = next(fmto.iter_data)
+        mask = data.copy(data=np.ones(data.shape, dtype=bool))
+        mask = mask.drop_vars(set(mask.coords) - set(mask.dims))
+        with tempfile.TemporaryDirectory(prefix="psyplot_") as tmpdir:
+            maskfile = os.path.join(tmpdir, "mask.nc")
+            mask.to_netcdf(maskfile)
+            ref = fmto._get_mask_source(data, maskfile)
+            relpath = os.path.relpath(maskfile)
+            self.assertIs(
+                fmto._get_mask_source(data, relpath).variable, ref.variable
+            )
+            # the file is already closed and loaded into memory
+            os.remove(maskfile)
+            self.assertTrue(ref.values.all())
+
+    def test_mask_numexpr(self):
+        """Test the numexpr implementation of the value masks"""
+        import psy_simple.base as psyb
+
+        if psyb.numexpr is None:
+            self.skipTest("numexpr is not installed")
+        val = self.masking_val
+        for key, value in [
+            ("maskless", val),
+            ("maskleq", val),
+            ("maskgreater", val),
+            ("maskgeq", val),
+            ("maskbetween", [val, val + 1]),
+        ]:
+            fmto = getattr(self.plotter, key)
+            for data in fmto.iter_data:
+                fmto._ne_min_size = np.inf
+                ref = fmto._mask_data(data, value)
+                fmto._ne_min_size = 0
+                masked = fmto._mask_data(data, value)
+                del fmto._ne_min_size
+                self.assertEqual(masked.dtype, ref.dtype, msg=key)
+                np.testing.assert_array_equal(
+                    masked.values, ref.values, err_msg=key
+                )
+                self.assertEqual(masked.attrs, ref.attrs, msg=key)
+
 
 class TestBase2D(object):
     """Test :class:`psyplot.plotter.baseplotter.BasePlotter` class without time
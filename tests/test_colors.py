@@ -12,6 +12,7 @@ import unittest
 
 import _base_testing as bt
 import matplotlib.pyplot as plt
+import numpy as np
 import six
 
 import psy_simple.colors as psyc
@@ -26,11 +27,18 @@ class TestShowColormaps(unittest.TestCase):
     def tearDown(self):
         plt.close("all")
 
+    @staticmethod
+    def _get_ncmaps(fig):
+        """Get the number of colormaps displayed in `fig`"""
+        if not fig.axes:
+            return 0
+        return fig.axes[0].images[0].get_array().shape[0]
+
     def test_all(self):
         """Test the display of all colormaps"""
         fig = psyc.show_colormaps(use_qt=False)
         self.assertEqual(fig.number, 1)
-        self.assertGreater(len(fig.axes), 15)
+        self.assertGreater(self._get_ncmaps(fig), 15)
 
     def test_some(self):
         """Test the display of a selection of colormaps"""
@@ -39,7 +47,22 @@ class TestShowColormaps(unittest.TestCase):
             ["jet", cmap, "red_white_blue"], use_qt=False
         )
         self.assertEqual(fig.number, 1)
-        self.assertEqual(len(fig.axes), 3)
+        self.assertEqual(self._get_ncmaps(fig), 3)
+        self.assertEqual(
+            [t.get_text() for t in fig.axes[0].get_yticklabels()],
+            ["jet", "Reds", "red_white_blue"],
+        )
+
+    def test_figure_height(self):
+        """Test that the figure height scales with the number of colormaps"""
+        height1 = psyc.show_colormaps("jet", use_qt=False).get_figheight()
+        height3 = psyc.show_colormaps(
+            ["jet", "Reds", "red_white_blue"], use_qt=False
+        ).get_figheight()
+        height_all = psyc.show_colormaps(use_qt=False).get_figheight()
+        self.assertLess(height1, height3)
+        self.assertLess(height3, height_all)
+        self.assertLessEqual(height_all, 10)
 
     @unittest.skipIf(
         six.PY2 or (bt.sns_version is not None and bt.sns_version < "0.8"),
@@ -65,6 +88,72 @@ class TestShowColormaps(unittest.TestCase):
         self.assertEqual(fig.number, 1)
         self.assertEqual(len(fig.axes), 0)
 
+    def test_multiple_wrong(self):
+        """Test that all unknown colormaps are filtered out"""
+        with self.assertWarns(UserWarning):
+            fig = psyc.show_colormaps(
+                ["jett", "asdfkj", "red_white_blue"], use_qt=False
+            )
+        self.assertEqual(self._get_ncmaps(fig), 1)
+
+
+class TestGetCmap(unittest.TestCase):
+    """Test the :func:`psy_simple.colors.get_cmap` function"""
+
+    def test_cached_copy(self):
+        """Test that cached colormaps are independent copies"""
+        cmap = psyc.get_cmap("red_white_blue", 11)
+        cmap.set_bad("r")
+        cmap2 = psyc.get_cmap("red_white_blue", 11)
+        self.assertIsNot(cmap, cmap2)
+        self.assertEqual(cmap2.N, 11)
+        self.assertNotEqual(tuple(cmap2.get_bad()), tuple(cmap.get_bad()))
+
+    def test_close_matches(self):
+        """Test the suggestions for misspelled colormap names"""
+        from difflib import get_close_matches
+
+        if psyc.process is None:
+            self.skipTest("rapidfuzz is not installed")
+        names = ["jet", "viridis", "Reds", "red_white_blue"]
+        for word in ["jett", "Red", "asdfkj"]:
+            self.assertEqual(
+                psyc._close_matches(word, names, cutoff=0.6),
+                get_close_matches(word, names, cutoff=0.6),
+                msg=word,
+            )
+
+    def test_reversed(self):
+        """Test the reversed colormaps of this module"""
+        cmapnames = psyc._cmapnames
+        self.assertIn("rwb_r", cmapnames)
+        self.assertIn("rwb_r", cmapnames.keys())
+        self.assertIn("rwb_r", list(cmapnames))
+        self.assertNotIn("w_Reds_r", cmapnames)
+        self.assertIsNone(cmapnames.get("w_Reds_r"))
+        self.assertEqual(len(cmapnames), len(list(cmapnames)))
+        self.assertEqual(dict(cmapnames.items()).keys(), cmapnames.keys())
+        np.testing.assert_array_equal(
+            cmapnames.get("rwb_r"), cmapnames["rwb"][::-1]
+        )
+        cmap = psyc.get_cmap("rwb_r")
+        self.assertEqual(tuple(cmap(0.0)), (0, 0, 1.0, 1.0))
+
+    def test_rc_cmaps(self):
+        """Test that changes of the rcParams cmaps are respected"""
+        from psyplot import rcParams
+
+        cmaps = rcParams["colors.cmaps"]
+        try:
+            cmaps["test_cmap"] = ["r", "b"]
+            cmap = psyc.get_cmap("test_cmap")
+            self.assertEqual(tuple(cmap(0.0)), (1.0, 0, 0, 1.0))
+            cmaps["test_cmap"] = ["g", "b"]
+            cmap = psyc.get_cmap("test_cmap")
+            self.assertEqual(tuple(cmap(0.0)), (0, 0.5, 0, 1.0))
+        finally:
+            cmaps.pop("test_cmap", None)
+
 
 if __name__ == "__main__":
     unittest.main()
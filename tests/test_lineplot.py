@@ -12,7 +12,7 @@ import os
 import sys
 import tempfile
 import unittest
-from itertools import chain
+from itertools import chain, islice
 
 import _base_testing as bt
 import matplotlib as mpl
@@ -23,6 +23,7 @@ import psyplot.project as psy
 import test_base as tb
 from psyplot import InteractiveList, open_dataset
 
+from psy_simple.colors import get_cmap
 from psy_simple.plotters import LinePlotter, mpl_version
 
 bold = tb.bold
@@ -395,6 +396,14 @@ class LinePlotterTest(tb.BasePlotterTest):
             [line.get_color() for line in self.plotter.ax.lines],
             current_colors,
         )
+        self.update(color="viridis")
+        n = len(list(self.plotter.color.iter_data))
+        ref = get_cmap("viridis")(np.linspace(0.0, 1.0, n))
+        self.assertEqual(len(self.plotter.color.colors), n)
+        np.testing.assert_array_equal(
+            list(islice(self.plotter.color.extended_colors, n + 1)),
+            np.vstack([ref, ref[:1]]),
+        )
 
     def test_transpose(self, *args):
         """Test transpose formatoption"""
@@ -427,6 +436,23 @@ class LinePlotterTest(tb.BasePlotterTest):
         self._test_DataTicksCalculator()
         self._test_DtTicksBase(*args)
 
+    def test_plotted_frame(self):
+        """Test the caching of the plotted data of the xticks"""
+        fmto = self.plotter.xticks
+        df = fmto.plotted_frame
+        self.assertIs(fmto.plotted_frame, df)
+        arr = self.plotter.plot_data
+        if isinstance(arr, InteractiveList):
+            arr = arr[0]
+        arr._variable = arr.variable.copy()
+        self.assertIsNot(fmto.plotted_frame, df)
+        self.assertTrue(fmto.plotted_frame.equals(df))
+        # replacing the values invalidates the cache as well
+        df = fmto.plotted_frame
+        arr.values = arr.values.copy()
+        self.assertIsNot(fmto.plotted_frame, df)
+        self.assertTrue(fmto.plotted_frame.equals(df))
+
     _max_rounded_ref = 400
 
     def _test_DataTicksCalculator(self):
@@ -593,6 +619,29 @@ class LinePlotterTest(tb.BasePlotterTest):
             all(t.get_size() == 10 for t in ax.get_xticklabels(minor=True))
         )
 
+    def test_marker(self):
+        """Test marker formatoption"""
+        if "marker" not in self.plotter:
+            self.skipTest("The plotter has no marker formatoption")
+        markers = ["o", "x", "s"]
+        n = len(self.plotter.ax.lines)
+        self.update(marker=markers)
+        self.assertEqual(
+            [line.get_marker() for line in self.plotter.ax.lines],
+            markers[:n],
+        )
+        self.plotter.update(replot=True, force=["plot"])
+        self.assertEqual(
+            [line.get_marker() for line in self.plotter.ax.lines],
+            markers[:n],
+        )
+
+    def test_tickprops_axis(self):
+        """Test the axes of the xtickprops and ytickprops formatoptions"""
+        ax = self.plotter.ax
+        self.assertIs(self.plotter.xtickprops.axis, ax.xaxis)
+        self.assertIs(self.plotter.ytickprops.axis, ax.yaxis)
+
     def test_axiscolor(self):
         """Test axiscolor formatoption"""
         ax = self.plotter.ax
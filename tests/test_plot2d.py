@@ -325,6 +325,25 @@ class Simple2DPlotterTest(tl.LinePlotterTest, References2D):
             atol=1e-2,
         )
 
+    def test_bounds_array(self):
+        """Test the caching of the array of the bounds formatoption"""
+        fmto = self.plotter.bounds
+        arr = fmto.array
+        self.assertIs(fmto.array, arr)
+        self.assertFalse(arr.flags.writeable)
+        limits = fmto._calc_vmin_vmax(5, 95)
+        self.assertIs(fmto._calc_vmin_vmax(5, 95), limits)
+        fmto.data._variable = fmto.data.variable.copy()
+        self.assertIsNot(fmto.array, arr)
+        self.assertAlmostArrayEqual(fmto.array, arr)
+        self.assertIsNot(fmto._calc_vmin_vmax(5, 95), limits)
+        self.assertEqual(fmto._calc_vmin_vmax(5, 95), limits)
+        # replacing the values invalidates the cache as well
+        arr = fmto.array
+        fmto.data.values = fmto.data.values.copy()
+        self.assertIsNot(fmto.array, arr)
+        self.assertAlmostArrayEqual(fmto.array, arr)
+
     def test_miss_color(self, *args):
         """Test miss_color formatoption"""
         self.update(maskless=280, miss_color="0.9")
@@ -387,6 +406,20 @@ def test_symlog_bounds():
     assert plotter.bounds.norm.boundaries[-1] == pytest.approx(0.1)
 
 
+def test_symlog_bounds_positive():
+    ds = xr.Dataset()
+    ds["test"] = (("y", "x"), np.random.randint(1, 100, (40, 50)) * 1e-3)
+    ds["x"] = ("x", np.arange(50))
+    ds["y"] = ("y", np.arange(40))
+
+    sp = ds.psy.plot.plot2d(bounds="symlog")
+    plotter = sp.plotters[0]
+
+    assert plotter.bounds.norm.boundaries[0] == pytest.approx(-0.001)
+    assert plotter.bounds.norm.boundaries[1] == pytest.approx(0.001)
+    assert plotter.bounds.norm.boundaries[-1] == pytest.approx(0.1)
+
+
 class Simple2DPlotterTestArtificial(unittest.TestCase):
     """A test case for artifial data"""
 
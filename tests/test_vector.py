@@ -112,6 +112,21 @@ class SimpleVectorPlotterTest(t2d.Simple2DPlotterTest):
     def test_miss_color(self):
         pass
 
+    def test_bounds_array(self):
+        """Test the array of the vector bounds formatoption"""
+        fmto = self.plotter.color.bounds
+        color = fmto.color._color_array
+        self.assertAlmostArrayEqual(fmto.array, color[~np.isnan(color)])
+        limits = fmto._calc_vmin_vmax(5, 95)
+        self.assertAlmostArrayEqual(
+            limits, np.percentile(color[~np.isnan(color)], [5, 95])
+        )
+        # the array follows the color formatoption
+        self.plotter.update(color="u")
+        u = fmto.color._color_array
+        self.assertAlmostArrayEqual(fmto.array, u[~np.isnan(u)])
+        self.assertNotEqual(fmto._calc_vmin_vmax(5, 95), limits)
+
     def test_cbarspacing(self, *args):
         """Test cbarspacing formatoption"""
         self.update(